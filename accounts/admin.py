@@ -6,7 +6,9 @@ This module contains admin configurations for user management and authentication
 
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.db.models.functions import Substr
 from django.utils.html import format_html
+from core.paginators import FasterAdminPaginator
 from .models import User, Profile, Role, RolePermission, UserRole, UserSession, PasswordResetToken
 
 
@@ -37,6 +39,8 @@ class UserAdmin(BaseUserAdmin):
         'last_name',
     ]
     ordering = ['last_name', 'first_name']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     fieldsets = (
         (None, {'fields': ('username', 'password')}),
@@ -72,11 +76,11 @@ class ProfileAdmin(admin.ModelAdmin):
         'created_at',
     ]
     search_fields = [
-        'user__first_name',
-        'user__last_name',
-        'user__email',
+        'user__email__exact',
         'city',
     ]
+    list_select_related = ['user']
+    raw_id_fields = ['user']
     readonly_fields = [
         'created_at',
         'updated_at',
@@ -158,6 +162,8 @@ class RolePermissionAdmin(admin.ModelAdmin):
         'permission__name',
         'permission__codename',
     ]
+    list_select_related = ['role', 'permission', 'permission__content_type']
+    raw_id_fields = ['permission']
     readonly_fields = [
         'created_at',
     ]
@@ -191,11 +197,11 @@ class UserRoleAdmin(admin.ModelAdmin):
         'assigned_at',
     ]
     search_fields = [
-        'user__first_name',
-        'user__last_name',
-        'user__email',
+        'user__email__exact',
         'role__name',
     ]
+    list_select_related = ['user', 'role', 'assigned_by']
+    raw_id_fields = ['user', 'assigned_by']
     readonly_fields = [
         'assigned_at',
     ]
@@ -228,18 +234,19 @@ class UserSessionAdmin(admin.ModelAdmin):
         'last_activity',
     ]
     search_fields = [
-        'user__first_name',
-        'user__last_name',
-        'user__email',
+        'session_key__exact',
+        'user__email__exact',
         'ip_address',
-        'session_key',
     ]
+    list_select_related = ['user']
     readonly_fields = [
         'session_key',
         'created_at',
         'last_activity',
     ]
     ordering = ['-last_activity']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
     
     def has_add_permission(self, request):
         """Disable adding new sessions."""
@@ -267,21 +274,30 @@ class PasswordResetTokenAdmin(admin.ModelAdmin):
         'expires_at',
     ]
     search_fields = [
-        'user__first_name',
-        'user__last_name',
-        'user__email',
-        'token',
+        'token__exact',
+        'user__email__exact',
     ]
+    list_select_related = ['user']
+    raw_id_fields = ['user']
     readonly_fields = [
         'token',
         'created_at',
     ]
     ordering = ['-created_at']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        """Compute the token preview in the database."""
+        return super().get_queryset(request).annotate(
+            token_preview=Substr('token', 1, 10)
+        )
     
     def token_preview(self, obj):
         """Show a preview of the token."""
-        return f"{obj.token[:10]}..."
+        return f"{obj.token_preview}..."
     token_preview.short_description = 'Token Preview'
+    token_preview.admin_order_field = 'token_preview'
     
     def has_add_permission(self, request):
         """Disable adding new tokens."""
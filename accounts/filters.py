@@ -0,0 +1,33 @@
+"""
+Accounts filters for the Farjad ERP system.
+
+This module contains the FilterSets for users, roles and role permissions.
+"""
+
+from django_filters.rest_framework import FilterSet
+
+from .models import Role, RolePermission, User
+
+
+class UserFilter(FilterSet):
+    """Filters for the user list."""
+
+    class Meta:
+        model = User
+        fields = ["is_active", "is_verified"]
+
+
+class RoleFilter(FilterSet):
+    """Filters for the role list."""
+
+    class Meta:
+        model = Role
+        fields = ["is_active"]
+
+
+class RolePermissionFilter(FilterSet):
+    """Filters for the role permission list."""
+
+    class Meta:
+        model = RolePermission
+        fields = ["role", "granted"]
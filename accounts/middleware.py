@@ -0,0 +1,20 @@
+"""
+Accounts middleware for the Farjad ERP system.
+
+This module contains middleware that resolves per-request client information.
+"""
+
+
+class ClientIPMiddleware:
+    """Resolve the client IP address once and store it on the request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
+        if x_forwarded_for:
+            request.client_ip = x_forwarded_for.partition(",")[0].strip()
+        else:
+            request.client_ip = request.META.get("REMOTE_ADDR")
+        return self.get_response(request)
@@ -0,0 +1,39 @@
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX accounts_user_username_trgm_idx ON accounts_user USING gin (UPPER(username::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX accounts_user_username_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX accounts_user_email_trgm_idx ON accounts_user USING gin (UPPER(email::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX accounts_user_email_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX accounts_user_first_name_trgm_idx ON accounts_user USING gin (UPPER(first_name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX accounts_user_first_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX accounts_user_last_name_trgm_idx ON accounts_user USING gin (UPPER(last_name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX accounts_user_last_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX accounts_role_name_trgm_idx ON accounts_role USING gin (UPPER(name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX accounts_role_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX accounts_profile_city_trgm_idx ON accounts_profile USING gin (UPPER(city::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX accounts_profile_city_trgm_idx;',
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+
+def populate_full_name(apps, schema_editor):
+    User = apps.get_model('accounts', 'User')
+    User.objects.update(full_name=Concat('first_name', Value(' '), 'last_name'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_trigram_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='full_name',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=301, verbose_name='Full name'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_full_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+def populate_permission_bitmap(apps, schema_editor):
+    Role = apps.get_model('accounts', 'Role')
+    RolePermission = apps.get_model('accounts', 'RolePermission')
+    for role in Role.objects.all():
+        bitmap = 0
+        granted = RolePermission.objects.filter(role=role, granted=True).values_list('permission_id', flat=True)
+        for permission_id in granted:
+            bitmap |= 1 << permission_id
+        Role.objects.filter(pk=role.pk).update(permission_bitmap=format(bitmap, 'x'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_full_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='role',
+            name='permission_bitmap',
+            field=models.TextField(default='0', editable=False, verbose_name='Permission bitmap'),
+        ),
+        migrations.RunPython(populate_permission_bitmap, migrations.RunPython.noop),
+    ]
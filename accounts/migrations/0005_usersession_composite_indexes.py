@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_role_permission_bitmap'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='usersession',
+            name='accounts_us_user_id_691a59_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='usersession',
+            name='accounts_us_is_acti_58b48a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='usersession',
+            name='accounts_us_last_ac_a630f7_idx',
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(fields=['user', 'is_active', '-last_activity'], name='user_sessions_by_activity'),
+        ),
+        migrations.AddIndex(
+            model_name='usersession',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['last_activity'], name='active_sessions_by_time'),
+        ),
+    ]
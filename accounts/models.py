@@ -4,23 +4,27 @@ User account models for the Farjad ERP system.
 This module contains user-related models including profiles, roles, and permissions.
 """
 
+from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
-from django.core.validators import RegexValidator
+
+from core.validators import PHONE_VALIDATOR
+
+TOKEN_CLAIMS_CACHE_KEY = 'accounts:token_claims:{}'  # noqa: S105 - a cache key, not a credential
+TOKEN_CLAIM_FIELDS = ('username', 'email', 'first_name', 'last_name', 'is_verified')
 
 
 class User(AbstractUser):
     """Extended User model with additional fields."""
     
     email = models.EmailField(_('Email address'), unique=True)
-    phone_regex = RegexValidator(
-        regex=r'^\+?1?\d{9,15}$',
-        message=_("Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.")
-    )
-    phone = models.CharField(_('Phone'), validators=[phone_regex], max_length=17, blank=True)
+    phone = models.CharField(_('Phone'), validators=[PHONE_VALIDATOR], max_length=17, blank=True)
     is_verified = models.BooleanField(_('Is verified'), default=False)
     last_login_ip = models.GenericIPAddressField(_('Last login IP'), null=True, blank=True)
+    full_name = models.CharField(_('Full name'), max_length=301, editable=False, db_index=True)
     
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['username', 'first_name', 'last_name']
@@ -34,10 +38,41 @@ class User(AbstractUser):
     def __str__(self):
         return f"{self.first_name} {self.last_name} ({self.email})"
 
-    @property
-    def full_name(self):
-        """Return the full name of the user."""
-        return f"{self.first_name} {self.last_name}"
+    def save(self, *args, **kwargs):
+        """Keep the stored full name in sync with first and last name."""
+        self.full_name = f"{self.first_name} {self.last_name}"
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'first_name', 'last_name'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'full_name'}
+        super().save(*args, **kwargs)
+
+    def get_permission_bitmap(self):
+        """Return the hex bitmap of permissions granted by the user's active roles."""
+        bitmap = 0
+        role_bitmaps = Role.objects.filter(
+            userrole__user=self,
+            userrole__is_active=True,
+            is_active=True,
+        ).values_list('permission_bitmap', flat=True)
+        for role_bitmap in role_bitmaps:
+            bitmap |= int(role_bitmap, 16)
+        return format(bitmap, 'x')
+
+    def get_token_claims(self):
+        """Return the custom JWT claims, cached for the refresh token lifetime."""
+        key = TOKEN_CLAIMS_CACHE_KEY.format(self.pk)
+        claims = cache.get(key)
+        if claims is None:
+            claims = {field: getattr(self, field) for field in TOKEN_CLAIM_FIELDS}
+            claims['perms'] = self.get_permission_bitmap()
+            timeout = settings.SIMPLE_JWT['REFRESH_TOKEN_LIFETIME'].total_seconds()
+            cache.set(key, claims, timeout)
+        return claims
+
+    @staticmethod
+    def invalidate_token_claims(*user_ids):
+        """Drop cached JWT claims for the given users."""
+        cache.delete_many([TOKEN_CLAIMS_CACHE_KEY.format(user_id) for user_id in user_ids])
 
 
 class Profile(models.Model):
@@ -66,10 +101,7 @@ class Profile(models.Model):
     emergency_contact_name = models.CharField(_('Emergency contact name'), max_length=100, blank=True)
     emergency_contact_phone = models.CharField(
         _('Emergency contact phone'),
-        validators=[RegexValidator(
-            regex=r'^\+?1?\d{9,15}$',
-            message=_("Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.")
-        )],
+        validators=[PHONE_VALIDATOR],
         max_length=17,
         blank=True
     )
@@ -90,6 +122,7 @@ class Role(models.Model):
     name = models.CharField(_('Name'), max_length=100, unique=True)
     description = models.TextField(_('Description'), blank=True)
     is_active = models.BooleanField(_('Is active'), default=True)
+    permission_bitmap = models.TextField(_('Permission bitmap'), default='0', editable=False)
     created_at = models.DateTimeField(_('Created at'), auto_now_add=True)
     updated_at = models.DateTimeField(_('Updated at'), auto_now=True)
     
@@ -109,6 +142,15 @@ class Role(models.Model):
     def __str__(self):
         return self.name
 
+    def refresh_permission_bitmap(self):
+        """Recompute the hex bitmap of granted permission ids."""
+        bitmap = 0
+        granted = self.rolepermission_set.filter(granted=True).values_list('permission_id', flat=True)
+        for permission_id in granted:
+            bitmap |= 1 << permission_id
+        self.permission_bitmap = format(bitmap, 'x')
+        Role.objects.filter(pk=self.pk).update(permission_bitmap=self.permission_bitmap)
+
 
 class RolePermission(models.Model):
     """Through model for Role and Permission many-to-many relationship."""
@@ -173,10 +215,13 @@ class UserSession(models.Model):
         verbose_name_plural = _('User Sessions')
         ordering = ['-last_activity']
         indexes = [
-            models.Index(fields=['user']),
+            models.Index(fields=['user', 'is_active', '-last_activity'], name='user_sessions_by_activity'),
             models.Index(fields=['session_key']),
-            models.Index(fields=['is_active']),
-            models.Index(fields=['last_activity']),
+            models.Index(
+                fields=['last_activity'],
+                condition=models.Q(is_active=True),
+                name='active_sessions_by_time',
+            ),
         ]
 
     def __str__(self):
@@ -209,5 +254,4 @@ class PasswordResetToken(models.Model):
 
     def is_expired(self):
         """Check if the token has expired."""
-        from django.utils import timezone
-        return timezone.now() > self.expires_at
\ No newline at end of file
+        return timezone.now() > self.expires_at
@@ -0,0 +1,52 @@
+"""
+Accounts signal handlers for the Farjad ERP system.
+
+This module keeps denormalized role data and cached token claims in sync
+with their source rows.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import TOKEN_CLAIM_FIELDS, Role, RolePermission, User, UserRole
+
+
+@receiver(post_save, sender=RolePermission)
+@receiver(post_delete, sender=RolePermission)
+def refresh_role_permission_bitmap(sender, instance, **kwargs):
+    """Rebuild the role's permission bitmap when its permissions change."""
+    role = Role.objects.filter(pk=instance.role_id).first()
+    if role is not None:
+        role.refresh_permission_bitmap()
+        invalidate_role_token_claims(role)
+
+
+def invalidate_role_token_claims(role):
+    """Drop cached token claims for every user holding the role."""
+    user_ids = UserRole.objects.filter(role=role).values_list('user_id', flat=True)
+    User.invalidate_token_claims(*user_ids)
+
+
+@receiver(post_save, sender=Role)
+def invalidate_claims_on_role_change(sender, instance, created, **kwargs):
+    """Drop cached claims when a role is toggled or edited."""
+    if not created:
+        invalidate_role_token_claims(instance)
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def invalidate_claims_on_user_role_change(sender, instance, **kwargs):
+    """Drop cached claims when a user's role assignments change."""
+    User.invalidate_token_claims(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+def invalidate_claims_on_user_change(sender, instance, update_fields=None, **kwargs):
+    """Drop cached claims when a claim field may have changed.
+
+    Saves that only touch other columns, such as the ``last_login`` update
+    made on every login, keep the cache warm.
+    """
+    if update_fields is None or set(update_fields) & set(TOKEN_CLAIM_FIELDS):
+        User.invalidate_token_claims(instance.pk)
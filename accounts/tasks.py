@@ -0,0 +1,51 @@
+"""
+Accounts background tasks for the Farjad ERP system.
+
+This module contains Celery tasks that keep bookkeeping writes off the request path.
+"""
+
+import json
+
+from celery import shared_task
+from django.conf import settings
+from django_redis import get_redis_connection
+
+from core.tasks import flush_buffer
+
+from .models import UserSession
+
+USER_SESSION_BUFFER_KEY = 'accounts:user_sessions'
+
+
+def queue_user_session(session_data):
+    """Buffer a login session for the next bulk insert."""
+    if not settings.USER_SESSION_BUFFER:
+        create_user_session.delay(**session_data)
+        return
+    get_redis_connection('default').rpush(USER_SESSION_BUFFER_KEY, json.dumps(session_data))
+
+
+@shared_task(ignore_result=True)
+def create_user_session(user_id, session_key, ip_address, user_agent):
+    """Record a login session for the given user."""
+    UserSession.objects.create(
+        user_id=user_id,
+        session_key=session_key,
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
+
+
+@shared_task(ignore_result=True)
+def flush_user_sessions():
+    """Bulk insert the login sessions buffered in Redis."""
+    batch_size = settings.USER_SESSION_BUFFER_BATCH_SIZE
+    flush_buffer(
+        USER_SESSION_BUFFER_KEY,
+        batch_size,
+        lambda rows: UserSession.objects.bulk_create(
+            [UserSession(**row) for row in rows],
+            batch_size=batch_size,
+            ignore_conflicts=True,
+        ),
+    )
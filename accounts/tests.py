@@ -1,3 +1,84 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
 
-# Create your tests here.
+from .models import Profile, UserSession
+
+User = get_user_model()
+
+
+class UserProfileViewTests(TestCase):
+    """The current user endpoint returns the user with their profile."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='member', email='member@example.com', password='pw',
+            first_name='Team', last_name='Member',
+        )
+        Profile.objects.create(user=self.user, city='Tehran')
+        self.client = APIClient()
+        self.client.credentials(
+            HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(self.user).access_token}'
+        )
+
+    def test_get_returns_user_and_profile(self):
+        response = self.client.get('/api/auth/me/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['email'], 'member@example.com')
+        self.assertEqual(response.data['profile']['city'], 'Tehran')
+
+    def test_patch_updates_the_authenticated_user(self):
+        response = self.client.patch('/api/auth/me/', {'first_name': 'Renamed'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.full_name, 'Renamed Member')
+
+
+class LoginViewTests(TestCase):
+    """Logging in returns tokens with the user and records the session after commit."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='member', email='member@example.com', password='secret-pass',
+            first_name='Team', last_name='Member',
+        )
+        self.client = APIClient()
+
+    def login(self, password):
+        return self.client.post(
+            '/api/auth/login/',
+            {'email': 'member@example.com', 'password': password},
+            format='json',
+            HTTP_X_FORWARDED_FOR='203.0.113.7, 10.0.0.1',
+            HTTP_USER_AGENT='tests',
+        )
+
+    def test_login_returns_tokens_and_records_the_session(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.login('secret-pass')
+            self.assertFalse(UserSession.objects.exists())
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('access', response.data)
+        self.assertIn('refresh', response.data)
+        self.assertEqual(response.data['user'], {
+            'id': self.user.pk,
+            'username': 'member',
+            'email': 'member@example.com',
+            'first_name': 'Team',
+            'last_name': 'Member',
+            'is_verified': False,
+        })
+        self.assertEqual(len(callbacks), 1)
+        session = UserSession.objects.get()
+        self.assertEqual(session.user, self.user)
+        self.assertEqual(session.ip_address, '203.0.113.7')
+        self.assertEqual(session.user_agent, 'tests')
+        self.assertEqual(len(session.session_key), 40)
+
+    def test_bad_password_records_nothing(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            response = self.login('wrong')
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(callbacks, [])
+        self.assertFalse(UserSession.objects.exists())
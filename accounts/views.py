@@ -4,6 +4,9 @@ Accounts views for the Farjad ERP system.
 This module contains views for user management, authentication, and profiles.
 """
 
+import secrets
+
+from django.db import transaction
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import extend_schema, extend_schema_view
 from rest_framework import generics, status, viewsets
@@ -11,9 +14,13 @@ from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework_simplejwt.views import TokenObtainPairView
 
+from core.mixins import AutoPrefetchMixin
+
+from .filters import UserFilter, RoleFilter, RolePermissionFilter
 from .models import (
     PasswordResetToken,
     Profile,
@@ -21,7 +28,6 @@ from .models import (
     RolePermission,
     User,
     UserRole,
-    UserSession,
 )
 from .serializers import (
     PermissionSerializer,
@@ -32,6 +38,7 @@ from .serializers import (
     UserRoleSerializer,
     UserSerializer,
 )
+from .tasks import queue_user_session
 
 
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
@@ -42,14 +49,26 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
         token = super().get_token(user)
 
         # Add custom claims
-        token["username"] = user.username
-        token["email"] = user.email
-        token["first_name"] = user.first_name
-        token["last_name"] = user.last_name
-        token["is_verified"] = user.is_verified
+        for claim, value in user.get_token_claims().items():
+            token[claim] = value
 
         return token
 
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        # Reuse the user loaded during authentication for the response payload
+        data["user"] = {
+            "id": self.user.id,
+            "username": self.user.username,
+            "email": self.user.email,
+            "first_name": self.user.first_name,
+            "last_name": self.user.last_name,
+            "is_verified": self.user.is_verified,
+        }
+
+        return data
+
 
 class LoginView(TokenObtainPairView):
     """Custom login view with enhanced token response."""
@@ -82,45 +101,23 @@ class LoginView(TokenObtainPairView):
         },
     )
     def post(self, request, *args, **kwargs):
-        response = super().post(request, *args, **kwargs)
-
-        if response.status_code == 200:
-            # Get user information - use email since USERNAME_FIELD is email
-            email = request.data.get("email") or request.data.get("username")
-            user = User.objects.get(email=email)
-            user_data = {
-                "id": user.id,
-                "username": user.username,
-                "email": user.email,
-                "first_name": user.first_name,
-                "last_name": user.last_name,
-                "is_verified": user.is_verified,
-            }
+        serializer = self.get_serializer(data=request.data)
 
-            # Add user data to response
-            response.data["user"] = user_data
+        try:
+            serializer.is_valid(raise_exception=True)
+        except TokenError as e:
+            raise InvalidToken(e.args[0]) from e
 
-            # Create user session with unique session key
-            import uuid
+        # Buffer the session for the next bulk insert
+        session_data = {
+            "user_id": serializer.user.pk,
+            "session_key": secrets.token_hex(20),
+            "ip_address": request.client_ip,
+            "user_agent": request.META.get("HTTP_USER_AGENT", ""),
+        }
+        transaction.on_commit(lambda: queue_user_session(session_data))
 
-            session_key = request.session.session_key or str(uuid.uuid4())
-            UserSession.objects.create(
-                user=user,
-                session_key=session_key,
-                ip_address=self.get_client_ip(request),
-                user_agent=request.META.get("HTTP_USER_AGENT", ""),
-            )
-
-        return response
-
-    def get_client_ip(self, request):
-        """Get client IP address."""
-        x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-        if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
-        else:
-            ip = request.META.get("REMOTE_ADDR")
-        return ip
+        return Response(serializer.validated_data, status=status.HTTP_200_OK)
 
 
 @extend_schema_view(
@@ -135,14 +132,27 @@ class LoginView(TokenObtainPairView):
     ),
     destroy=extend_schema(summary="Delete user", description="Delete a specific user"),
 )
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing users."""
 
-    queryset = User.objects.all()
+    queryset = User.objects.only(
+        "id",
+        "username",
+        "email",
+        "first_name",
+        "last_name",
+        "full_name",
+        "phone",
+        "is_active",
+        "is_verified",
+        "date_joined",
+        "last_login",
+        "last_login_ip",
+    )
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ["is_active", "is_verified"]
+    filterset_class = UserFilter
     search_fields = ["first_name", "last_name", "email", "username"]
     ordering_fields = ["first_name", "last_name", "date_joined"]
     ordering = ["last_name", "first_name"]
@@ -167,10 +177,27 @@ class UserViewSet(viewsets.ModelViewSet):
         summary="Delete profile", description="Delete a specific profile"
     ),
 )
-class ProfileViewSet(viewsets.ModelViewSet):
+class ProfileViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing user profiles."""
 
-    queryset = Profile.objects.all()
+    queryset = Profile.objects.select_related("user").only(
+        "id",
+        "user__id",
+        "user__email",
+        "user__full_name",
+        "avatar",
+        "gender",
+        "date_of_birth",
+        "bio",
+        "address",
+        "city",
+        "country",
+        "postal_code",
+        "emergency_contact_name",
+        "emergency_contact_phone",
+        "created_at",
+        "updated_at",
+    )
     serializer_class = ProfileSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
@@ -191,14 +218,14 @@ class ProfileViewSet(viewsets.ModelViewSet):
     ),
     destroy=extend_schema(summary="Delete role", description="Delete a specific role"),
 )
-class RoleViewSet(viewsets.ModelViewSet):
+class RoleViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing roles."""
 
     queryset = Role.objects.all()
     serializer_class = RoleSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ["is_active"]
+    filterset_class = RoleFilter
     search_fields = ["name", "description"]
     ordering_fields = ["name", "created_at"]
     ordering = ["name"]
@@ -212,14 +239,14 @@ class RoleViewSet(viewsets.ModelViewSet):
         summary="Get permission", description="Retrieve a specific permission"
     ),
 )
-class PermissionViewSet(viewsets.ReadOnlyModelViewSet):
+class PermissionViewSet(AutoPrefetchMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for viewing permissions."""
 
     queryset = RolePermission.objects.all()
     serializer_class = PermissionSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ["role", "granted"]
+    filterset_class = RolePermissionFilter
     search_fields = ["permission__name", "permission__content_type__model"]
     ordering_fields = ["created_at"]
     ordering = ["-created_at"]
@@ -5,12 +5,15 @@ This module contains admin configurations for core functionality.
 """
 
 from django.contrib import admin
+from django.db.models.functions import Substr
 from django.utils.html import format_html
+from .mixins import ChangelistOnlyMixin
 from .models import Contact, Company, Address, SystemConfiguration, AuditLog
+from .paginators import FasterAdminPaginator
 
 
 @admin.register(Contact)
-class ContactAdmin(admin.ModelAdmin):
+class ContactAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     """Admin configuration for Contact model."""
     
     list_display = [
@@ -38,6 +41,18 @@ class ContactAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['last_name', 'first_name']
+    raw_id_fields = ['created_by', 'updated_by']
+    list_only_fields = [
+        'id',
+        'first_name',
+        'last_name',
+        'full_name',
+        'email',
+        'phone',
+        'contact_type',
+        'is_active',
+        'created_at',
+    ]
     
     fieldsets = (
         ('Basic Information', {
@@ -57,7 +72,7 @@ class ContactAdmin(admin.ModelAdmin):
 
 
 @admin.register(Company)
-class CompanyAdmin(admin.ModelAdmin):
+class CompanyAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     """Admin configuration for Company model."""
     
     list_display = [
@@ -85,6 +100,16 @@ class CompanyAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['name']
+    raw_id_fields = ['created_by', 'updated_by']
+    list_only_fields = [
+        'id',
+        'name',
+        'company_type',
+        'email',
+        'phone',
+        'is_active',
+        'created_at',
+    ]
     
     fieldsets = (
         ('Basic Information', {
@@ -110,7 +135,7 @@ class CompanyAdmin(admin.ModelAdmin):
 
 
 @admin.register(Address)
-class AddressAdmin(admin.ModelAdmin):
+class AddressAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     """Admin configuration for Address model."""
     
     list_display = [
@@ -141,6 +166,18 @@ class AddressAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['city', 'street_address']
+    list_select_related = ['contact', 'company']
+    raw_id_fields = ['contact', 'company', 'created_by', 'updated_by']
+    list_only_fields = [
+        'id',
+        'contact__full_name',
+        'company__name',
+        'address_type',
+        'street_address',
+        'city',
+        'country',
+        'is_primary',
+    ]
     
     def get_entity_name(self, obj):
         """Get the name of the associated entity."""
@@ -191,12 +228,19 @@ class SystemConfigurationAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['key']
+    raw_id_fields = ['created_by', 'updated_by']
+    
+    def get_queryset(self, request):
+        """Compute the value preview in the database instead of loading values."""
+        return super().get_queryset(request).defer('value').annotate(
+            value_start=Substr('value', 1, 51)
+        )
     
     def value_preview(self, obj):
         """Show a preview of the value."""
-        if len(obj.value) > 50:
-            return f"{obj.value[:50]}..."
-        return obj.value
+        if len(obj.value_start) > 50:
+            return f"{obj.value_start[:50]}..."
+        return obj.value_start
     value_preview.short_description = 'Value Preview'
     
     fieldsets = (
@@ -214,7 +258,7 @@ class SystemConfigurationAdmin(admin.ModelAdmin):
 
 
 @admin.register(AuditLog)
-class AuditLogAdmin(admin.ModelAdmin):
+class AuditLogAdmin(ChangelistOnlyMixin, admin.ModelAdmin):
     """Admin configuration for AuditLog model."""
     
     list_display = [
@@ -248,6 +292,18 @@ class AuditLogAdmin(admin.ModelAdmin):
         'created_at',
     ]
     ordering = ['-created_at']
+    list_select_related = ['user']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    list_only_fields = [
+        'id',
+        'user',
+        'action',
+        'model_name',
+        'object_repr',
+        'ip_address',
+        'created_at',
+    ]
     
     def has_add_permission(self, request):
         """Disable adding new audit logs."""
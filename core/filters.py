@@ -0,0 +1,49 @@
+"""
+Core filters for the Farjad ERP system.
+
+This module contains the FilterSets for core contacts, companies, addresses and audit logs.
+"""
+
+from django_filters.rest_framework import FilterSet
+
+from .models import Address, AuditLog, Company, Contact, SystemConfiguration
+
+
+class ContactFilter(FilterSet):
+    """Filters for the contact list."""
+
+    class Meta:
+        model = Contact
+        fields = ['contact_type', 'is_active']
+
+
+class CompanyFilter(FilterSet):
+    """Filters for the company list."""
+
+    class Meta:
+        model = Company
+        fields = ['company_type', 'is_active']
+
+
+class AddressFilter(FilterSet):
+    """Filters for the address list."""
+
+    class Meta:
+        model = Address
+        fields = ['address_type', 'is_primary', 'contact', 'company']
+
+
+class SystemConfigurationFilter(FilterSet):
+    """Filters for the system configuration list."""
+
+    class Meta:
+        model = SystemConfiguration
+        fields = ['is_active']
+
+
+class AuditLogFilter(FilterSet):
+    """Filters for the audit log list."""
+
+    class Meta:
+        model = AuditLog
+        fields = ['action', 'model_name', 'user']
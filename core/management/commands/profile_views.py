@@ -0,0 +1,42 @@
+"""
+Print query plans for the core API list endpoints.
+
+Run ``python manage.py profile_views --analyze`` against a database with
+realistic data to check that list queries hit the expected indexes.
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from core.views import AddressViewSet, AuditLogViewSet, CompanyViewSet, ContactViewSet
+
+VIEWSETS = [ContactViewSet, CompanyViewSet, AddressViewSet, AuditLogViewSet]
+
+
+class Command(BaseCommand):
+    help = 'Print EXPLAIN output for the first page of each core list endpoint.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--analyze',
+            action='store_true',
+            help='Execute the queries and include timings and buffer usage (PostgreSQL only).',
+        )
+
+    def handle(self, *args, **options):
+        for viewset in VIEWSETS:
+            view = viewset(action='list', request=None, format_kwarg=None, kwargs={})
+            queryset = view.get_queryset()
+            if view.ordering:
+                queryset = queryset.order_by(*view.ordering)
+            page_size = view.paginator.page_size if view.paginator else None
+            if page_size:
+                queryset = queryset[:page_size]
+
+            explain_options = {}
+            if options['analyze'] and connections[queryset.db].vendor == 'postgresql':
+                explain_options = {'analyze': True, 'buffers': True}
+
+            self.stdout.write(self.style.MIGRATE_HEADING(viewset.__name__))
+            self.stdout.write(queryset.explain(**explain_options))
+            self.stdout.write('')
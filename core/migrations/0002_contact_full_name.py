@@ -0,0 +1,25 @@
+from django.db import migrations, models
+from django.db.models import Value
+from django.db.models.functions import Concat
+
+
+def populate_full_name(apps, schema_editor):
+    Contact = apps.get_model('core', 'Contact')
+    Contact.objects.update(full_name=Concat('first_name', Value(' '), 'last_name'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='full_name',
+            field=models.CharField(db_index=True, default='', editable=False, max_length=201, verbose_name='Full name'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_full_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_contact_full_name'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_user_id_2ff9b7_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_model_n_36490f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='company',
+            name='core_compan_company_7ec0a1_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='contact',
+            name='core_contac_contact_340f61_idx',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['user', '-created_at'], name='audit_logs_by_user'),
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['model_name', 'created_at'], name='audit_logs_by_model'),
+        ),
+        migrations.AddIndex(
+            model_name='company',
+            index=models.Index(fields=['company_type', 'is_active', 'name'], name='company_type_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['contact_type', 'is_active', 'last_name', 'first_name'], name='contact_type_active_name_idx'),
+        ),
+    ]
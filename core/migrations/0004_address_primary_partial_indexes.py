@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_composite_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='address',
+            name='core_addres_is_prim_e4d52e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='address',
+            index=models.Index(condition=models.Q(('is_primary', True)), fields=['company'], name='addr_primary_company_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='address',
+            index=models.Index(condition=models.Q(('is_primary', True)), fields=['contact'], name='addr_primary_contact_idx'),
+        ),
+    ]
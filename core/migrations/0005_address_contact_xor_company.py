@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_address_primary_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='address',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('company__isnull', True), ('contact__isnull', False)), models.Q(('company__isnull', False), ('contact__isnull', True)), _connector='OR'), name='address_contact_xor_company', violation_error_message='Specify either a contact or a company, but not both.'),
+        ),
+    ]
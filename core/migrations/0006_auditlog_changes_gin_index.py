@@ -0,0 +1,17 @@
+from django.db import migrations
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_address_contact_xor_company'),
+    ]
+
+    operations = [
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_auditlog_changes_gin_idx ON core_auditlog USING gin (changes jsonb_path_ops);',
+            reverse_sql='DROP INDEX core_auditlog_changes_gin_idx;',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 01:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_auditlog_changes_gin_index'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='contact',
+            constraint=models.CheckConstraint(check=models.Q(models.Q(('phone', ''), ('phone__regex', '^\\+?1?\\d{9,15}$'), _connector='OR'), models.Q(('mobile', ''), ('mobile__regex', '^\\+?1?\\d{9,15}$'), _connector='OR')), name='contact_phone_format', violation_error_message="Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed."),
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_contact_phone_format'),
+    ]
+
+    operations = [
+        PostgreSQLRunSQL(
+            sql='ALTER TABLE core_contact ALTER COLUMN notes SET STORAGE EXTERNAL;',
+            reverse_sql='ALTER TABLE core_contact ALTER COLUMN notes SET STORAGE EXTENDED;',
+        ),
+        PostgreSQLRunSQL(
+            sql='ALTER TABLE core_company ALTER COLUMN notes SET STORAGE EXTERNAL;',
+            reverse_sql='ALTER TABLE core_company ALTER COLUMN notes SET STORAGE EXTENDED;',
+        ),
+        PostgreSQLRunSQL(
+            sql='ALTER TABLE core_auditlog ALTER COLUMN user_agent SET STORAGE EXTERNAL;',
+            reverse_sql='ALTER TABLE core_auditlog ALTER COLUMN user_agent SET STORAGE EXTENDED;',
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:05
+
+from django.db import migrations, models
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_external_storage_wide_text'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='auditlog',
+            name='core_auditl_action_d9fb24_idx',
+        ),
+        migrations.AddIndex(
+            model_name='auditlog',
+            index=models.Index(fields=['action', 'model_name', '-created_at'], name='audit_logs_by_action'),
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE EXTENSION IF NOT EXISTS pg_trgm;',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_contact_first_name_trgm_idx ON core_contact USING gin (UPPER(first_name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_contact_first_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_contact_last_name_trgm_idx ON core_contact USING gin (UPPER(last_name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_contact_last_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_contact_email_trgm_idx ON core_contact USING gin (UPPER(email::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_contact_email_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_contact_phone_trgm_idx ON core_contact USING gin (UPPER(phone::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_contact_phone_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_company_name_trgm_idx ON core_company USING gin (UPPER(name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_company_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_company_legal_name_trgm_idx ON core_company USING gin (UPPER(legal_name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_company_legal_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_company_email_trgm_idx ON core_company USING gin (UPPER(email::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_company_email_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_company_tax_id_trgm_idx ON core_company USING gin (UPPER(tax_id::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_company_tax_id_trgm_idx;',
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_filter_listing_indexes'),
+    ]
+
+    operations = [
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_address_street_address_trgm_idx ON core_address USING gin (UPPER(street_address::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_address_street_address_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_address_city_trgm_idx ON core_address USING gin (UPPER(city::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_address_city_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_address_state_trgm_idx ON core_address USING gin (UPPER(state::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_address_state_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_address_postal_code_trgm_idx ON core_address USING gin (UPPER(postal_code::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_address_postal_code_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_auditlog_object_repr_trgm_idx ON core_auditlog USING gin (UPPER(object_repr::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_auditlog_object_repr_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX core_auditlog_ip_address_trgm_idx ON core_auditlog USING gin (UPPER(HOST(ip_address)) gin_trgm_ops);',
+            reverse_sql='DROP INDEX core_auditlog_ip_address_trgm_idx;',
+        ),
+    ]
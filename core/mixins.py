@@ -0,0 +1,161 @@
+"""
+View mixins for the Farjad ERP system.
+
+This module contains mixins shared by the API viewsets and admins of every app.
+"""
+
+from functools import lru_cache
+import hashlib
+import time
+
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.response import Response
+from rest_framework.serializers import BaseSerializer, ListSerializer
+
+from .models import AuditAction
+from .tasks import queue_audit_log
+
+LIST_CACHE_TIMEOUT = 300
+
+
+@lru_cache(maxsize=None)
+def related_lookups(serializer_class, model):
+    """
+    Return the ``(select_related, prefetch_related)`` lookups a serializer needs.
+
+    Dotted sources such as ``user.full_name`` and nested serializers are walked
+    against the model's fields. Single-valued relations are joined and
+    multi-valued relations, with everything below them, are prefetched.
+    """
+    select, prefetch = [], []
+    _collect_lookups(serializer_class().fields, model, '', False, select, prefetch)
+    return tuple(select), tuple(prefetch)
+
+
+def _collect_lookups(fields, model, prefix, under_many, select, prefetch):
+    for field in fields.values():
+        if field.source == '*' or getattr(field, 'write_only', False):
+            continue
+        nested = isinstance(field, BaseSerializer)
+        current, path = model, prefix
+        many = under_many
+        attrs = field.source_attrs
+        for index, attr in enumerate(attrs):
+            try:
+                model_field = current._meta.get_field(attr)
+            except FieldDoesNotExist:
+                break
+            if not model_field.is_relation:
+                break
+            to_many = model_field.many_to_many or model_field.one_to_many
+            is_last = index == len(attrs) - 1
+            # A plain forward foreign key only needs its id column.
+            if is_last and not nested and not to_many and model_field.concrete:
+                break
+            many = many or to_many
+            path = f'{path}__{attr}' if path else attr
+            lookups = prefetch if many else select
+            if path not in lookups:
+                lookups.append(path)
+            current = model_field.related_model
+        else:
+            if nested:
+                child = field.child if isinstance(field, ListSerializer) else field
+                _collect_lookups(child.fields, current, path, many, select, prefetch)
+
+
+class AutoPrefetchMixin:
+    """Apply the related lookups of the serializer to the viewset queryset."""
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        select, prefetch = related_lookups(self.get_serializer_class(), queryset.model)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        return queryset
+
+
+class AuditLogMixin:
+    """Record creates, updates and deletes made through the viewset in the audit log."""
+
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        self.log_action(AuditAction.CREATE, serializer.instance, serializer)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.log_action(AuditAction.UPDATE, serializer.instance, serializer)
+
+    def perform_destroy(self, instance):
+        # The primary key is gone once the row is deleted
+        self.log_action(AuditAction.DELETE, instance)
+        super().perform_destroy(instance)
+
+    def log_action(self, action, instance, serializer=None):
+        changes = {}
+        if serializer is not None:
+            changes = {
+                name: serializer.data[name] for name in serializer.validated_data if name in serializer.data
+            }
+        queue_audit_log(
+            user_id=self.request.user.pk,
+            action=action,
+            model_name=instance._meta.model_name,
+            object_id=str(instance.pk),
+            object_repr=str(instance)[:200],
+            changes=changes,
+            ip_address=self.request.client_ip,
+            user_agent=self.request.META.get('HTTP_USER_AGENT', ''),
+        )
+
+
+class ChangelistOnlyMixin:
+    """Load only ``list_only_fields`` when rendering the admin changelist."""
+
+    list_only_fields = ()
+
+    def get_queryset(self, request):
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if self.list_only_fields and match and match.url_name.endswith('_changelist'):
+            queryset = queryset.only(*self.list_only_fields)
+        return queryset
+
+
+def _list_cache_version_key(model):
+    return f'core:list_version:{model._meta.label_lower}'
+
+
+def invalidate_list_cache(model):
+    """Retire every cached list response for ``model``."""
+    cache.set(_list_cache_version_key(model), time.time_ns(), None)
+
+
+class CachedListMixin:
+    """
+    Serve list responses from the cache until a row of the model changes.
+
+    Entries are keyed by the full request URL under a per-model version that
+    ``invalidate_list_cache`` replaces, so writes never serve stale pages.
+    The version moves on ``post_save``/``post_delete``; ``QuerySet.update()``,
+    ``bulk_create()`` and ``bulk_update()`` send neither, so callers using them
+    on a cached model must call ``invalidate_list_cache`` themselves.
+    Only suitable for lists that look the same to every authenticated user.
+    """
+
+    list_cache_timeout = LIST_CACHE_TIMEOUT
+
+    def list(self, request, *args, **kwargs):
+        model = self.get_queryset().model
+        version = cache.get_or_set(_list_cache_version_key(model), time.time_ns, None)
+        url = hashlib.md5(request.build_absolute_uri().encode(), usedforsecurity=False).hexdigest()
+        key = f'core:list:{model._meta.label_lower}:{version}:{url}'
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        cache.set(key, response.data, self.list_cache_timeout)
+        return response
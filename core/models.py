@@ -7,10 +7,15 @@ This module contains the fundamental models that are used across the entire syst
 from django.db import models
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
-from django.core.validators import RegexValidator
+
+from .validators import PHONE_MESSAGE, PHONE_PATTERN, PHONE_VALIDATOR
 
 User = get_user_model()
 
+CONTACT_STATISTICS_CACHE_KEY = 'core:contact_statistics:v1'
+COMPANY_STATISTICS_CACHE_KEY = 'core:company_statistics:v1'
+STATISTICS_CACHE_TIMEOUT = 60
+
 
 class TimeStampedModel(models.Model):
     """Abstract base class with self-updating created and modified fields."""
@@ -38,26 +43,25 @@ class TimeStampedModel(models.Model):
         abstract = True
 
 
+class ContactType(models.TextChoices):
+    """Contact classifications."""
+
+    CUSTOMER = 'customer', _('Customer')
+    SUPPLIER = 'supplier', _('Supplier')
+    EMPLOYEE = 'employee', _('Employee')
+    OTHER = 'other', _('Other')
+
+
 class Contact(TimeStampedModel):
     """Contact information for customers, suppliers, and other entities."""
     
-    CONTACT_TYPES = [
-        ('customer', _('Customer')),
-        ('supplier', _('Supplier')),
-        ('employee', _('Employee')),
-        ('other', _('Other')),
-    ]
-    
     first_name = models.CharField(_('First name'), max_length=100)
     last_name = models.CharField(_('Last name'), max_length=100)
+    full_name = models.CharField(_('Full name'), max_length=201, editable=False, db_index=True)
     email = models.EmailField(_('Email'), unique=True)
-    phone_regex = RegexValidator(
-        regex=r'^\+?1?\d{9,15}$',
-        message=_("Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.")
-    )
-    phone = models.CharField(_('Phone'), validators=[phone_regex], max_length=17, blank=True)
-    mobile = models.CharField(_('Mobile'), validators=[phone_regex], max_length=17, blank=True)
-    contact_type = models.CharField(_('Contact type'), max_length=20, choices=CONTACT_TYPES)
+    phone = models.CharField(_('Phone'), validators=[PHONE_VALIDATOR], max_length=17, blank=True)
+    mobile = models.CharField(_('Mobile'), validators=[PHONE_VALIDATOR], max_length=17, blank=True)
+    contact_type = models.CharField(_('Contact type'), max_length=20, choices=ContactType.choices)
     is_active = models.BooleanField(_('Is active'), default=True)
     notes = models.TextField(_('Notes'), blank=True)
     
@@ -67,33 +71,51 @@ class Contact(TimeStampedModel):
         ordering = ['last_name', 'first_name']
         indexes = [
             models.Index(fields=['email']),
-            models.Index(fields=['contact_type']),
+            models.Index(
+                fields=['contact_type', 'is_active', 'last_name', 'first_name'],
+                name='contact_type_active_name_idx',
+            ),
             models.Index(fields=['is_active']),
         ]
+        constraints = [
+            models.CheckConstraint(
+                check=(
+                    (models.Q(phone='') | models.Q(phone__regex=PHONE_PATTERN))
+                    & (models.Q(mobile='') | models.Q(mobile__regex=PHONE_PATTERN))
+                ),
+                name='contact_phone_format',
+                violation_error_message=PHONE_MESSAGE,
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.first_name} {self.last_name}"
+        return self.full_name
+
+    def save(self, *args, **kwargs):
+        """Keep the stored full name in sync with first and last name."""
+        self.full_name = f"{self.first_name} {self.last_name}"
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'first_name', 'last_name'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'full_name'}
+        super().save(*args, **kwargs)
+
+
+class CompanyType(models.TextChoices):
+    """Company classifications."""
 
-    @property
-    def full_name(self):
-        """Return the full name of the contact."""
-        return f"{self.first_name} {self.last_name}"
+    CUSTOMER = 'customer', _('Customer')
+    SUPPLIER = 'supplier', _('Supplier')
+    PARTNER = 'partner', _('Partner')
+    COMPETITOR = 'competitor', _('Competitor')
+    OTHER = 'other', _('Other')
 
 
 class Company(TimeStampedModel):
     """Company information for customers, suppliers, and partners."""
     
-    COMPANY_TYPES = [
-        ('customer', _('Customer')),
-        ('supplier', _('Supplier')),
-        ('partner', _('Partner')),
-        ('competitor', _('Competitor')),
-        ('other', _('Other')),
-    ]
-    
     name = models.CharField(_('Company name'), max_length=200, unique=True)
     legal_name = models.CharField(_('Legal name'), max_length=200, blank=True)
-    company_type = models.CharField(_('Company type'), max_length=20, choices=COMPANY_TYPES)
+    company_type = models.CharField(_('Company type'), max_length=20, choices=CompanyType.choices)
     tax_id = models.CharField(_('Tax ID'), max_length=50, blank=True, unique=True, null=True)
     registration_number = models.CharField(_('Registration number'), max_length=50, blank=True)
     website = models.URLField(_('Website'), blank=True)
@@ -109,7 +131,7 @@ class Company(TimeStampedModel):
         ordering = ['name']
         indexes = [
             models.Index(fields=['name']),
-            models.Index(fields=['company_type']),
+            models.Index(fields=['company_type', 'is_active', 'name'], name='company_type_active_name_idx'),
             models.Index(fields=['is_active']),
         ]
 
@@ -117,17 +139,19 @@ class Company(TimeStampedModel):
         return self.name
 
 
+class AddressType(models.TextChoices):
+    """Address purposes."""
+
+    BILLING = 'billing', _('Billing')
+    SHIPPING = 'shipping', _('Shipping')
+    OFFICE = 'office', _('Office')
+    WAREHOUSE = 'warehouse', _('Warehouse')
+    OTHER = 'other', _('Other')
+
+
 class Address(TimeStampedModel):
     """Address information for contacts and companies."""
     
-    ADDRESS_TYPES = [
-        ('billing', _('Billing')),
-        ('shipping', _('Shipping')),
-        ('office', _('Office')),
-        ('warehouse', _('Warehouse')),
-        ('other', _('Other')),
-    ]
-    
     contact = models.ForeignKey(
         Contact,
         on_delete=models.CASCADE,
@@ -144,7 +168,7 @@ class Address(TimeStampedModel):
         related_name='addresses',
         verbose_name=_('Company')
     )
-    address_type = models.CharField(_('Address type'), max_length=20, choices=ADDRESS_TYPES)
+    address_type = models.CharField(_('Address type'), max_length=20, choices=AddressType.choices)
     street_address = models.CharField(_('Street address'), max_length=255)
     city = models.CharField(_('City'), max_length=100)
     state = models.CharField(_('State/Province'), max_length=100)
@@ -160,23 +184,32 @@ class Address(TimeStampedModel):
             models.Index(fields=['contact']),
             models.Index(fields=['company']),
             models.Index(fields=['address_type']),
-            models.Index(fields=['is_primary']),
+            models.Index(
+                fields=['company'],
+                condition=models.Q(is_primary=True),
+                name='addr_primary_company_idx',
+            ),
+            models.Index(
+                fields=['contact'],
+                condition=models.Q(is_primary=True),
+                name='addr_primary_contact_idx',
+            ),
+        ]
+        constraints = [
+            models.CheckConstraint(
+                check=(
+                    models.Q(contact__isnull=False, company__isnull=True)
+                    | models.Q(contact__isnull=True, company__isnull=False)
+                ),
+                name='address_contact_xor_company',
+                violation_error_message=_('Specify either a contact or a company, but not both.'),
+            ),
         ]
 
     def __str__(self):
         entity = self.contact or self.company
         return f"{entity} - {self.street_address}, {self.city}"
 
-    def clean(self):
-        """Validate that either contact or company is provided, but not both."""
-        from django.core.exceptions import ValidationError
-        
-        if not self.contact and not self.company:
-            raise ValidationError(_('Either contact or company must be specified.'))
-        
-        if self.contact and self.company:
-            raise ValidationError(_('Cannot specify both contact and company.'))
-
 
 class SystemConfiguration(TimeStampedModel):
     """System-wide configuration settings."""
@@ -199,18 +232,20 @@ class SystemConfiguration(TimeStampedModel):
         return f"{self.key}: {self.value[:50]}"
 
 
+class AuditAction(models.TextChoices):
+    """Actions recorded in the audit log."""
+
+    CREATE = 'create', _('Create')
+    UPDATE = 'update', _('Update')
+    DELETE = 'delete', _('Delete')
+    VIEW = 'view', _('View')
+    LOGIN = 'login', _('Login')
+    LOGOUT = 'logout', _('Logout')
+
+
 class AuditLog(TimeStampedModel):
     """Audit log for tracking changes to important models."""
     
-    ACTION_TYPES = [
-        ('create', _('Create')),
-        ('update', _('Update')),
-        ('delete', _('Delete')),
-        ('view', _('View')),
-        ('login', _('Login')),
-        ('logout', _('Logout')),
-    ]
-    
     user = models.ForeignKey(
         User,
         on_delete=models.SET_NULL,
@@ -218,7 +253,7 @@ class AuditLog(TimeStampedModel):
         blank=True,
         verbose_name=_('User')
     )
-    action = models.CharField(_('Action'), max_length=20, choices=ACTION_TYPES)
+    action = models.CharField(_('Action'), max_length=20, choices=AuditAction.choices)
     model_name = models.CharField(_('Model name'), max_length=100)
     object_id = models.CharField(_('Object ID'), max_length=100, blank=True)
     object_repr = models.CharField(_('Object representation'), max_length=200, blank=True)
@@ -231,9 +266,9 @@ class AuditLog(TimeStampedModel):
         verbose_name_plural = _('Audit Logs')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['action']),
-            models.Index(fields=['model_name']),
+            models.Index(fields=['user', '-created_at'], name='audit_logs_by_user'),
+            models.Index(fields=['action', 'model_name', '-created_at'], name='audit_logs_by_action'),
+            models.Index(fields=['model_name', 'created_at'], name='audit_logs_by_model'),
             models.Index(fields=['created_at']),
         ]
 
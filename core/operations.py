@@ -0,0 +1,20 @@
+"""
+Custom migration operations for the Farjad ERP system.
+
+This module contains operations for PostgreSQL-only schema features such as
+GIN/BRIN indexes, which are skipped on the SQLite databases used in development.
+"""
+
+from django.db import migrations
+
+
+class PostgreSQLRunSQL(migrations.RunSQL):
+    """RunSQL operation that only executes on PostgreSQL connections."""
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
@@ -0,0 +1,201 @@
+"""
+API pagination classes for the Farjad ERP system.
+
+This module contains DRF pagination classes for list endpoints on large tables.
+"""
+
+from functools import reduce
+import hashlib
+import json
+from operator import or_
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import EmptyPage, Paginator
+from django.db.models import Q, QuerySet
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import (
+    CursorPagination,
+    PageNumberPagination,
+    _reverse_ordering,
+)
+
+PAGE_COUNT_CACHE_TIMEOUT = 60
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches the ``COUNT(*)`` of a queryset for a short while.
+
+    The key is the compiled SQL, so every filter, search term and permission
+    restriction gets its own entry. Only the reported total may lag writes, by
+    up to ``PAGE_COUNT_CACHE_TIMEOUT`` seconds: pages are sliced from the rows
+    themselves, one row past the page is fetched to detect a following page,
+    and a page that reaches the end of the rows corrects the cached total.
+    """
+
+    @cached_property
+    def _count_cache_key(self):
+        sql, params = self.object_list.query.sql_with_params()
+        digest = hashlib.md5(f'{sql}{params!r}'.encode(), usedforsecurity=False).hexdigest()
+        return f'core:page_count:{digest}'
+
+    @cached_property
+    def count(self):
+        if not isinstance(self.object_list, QuerySet):
+            return super().count
+        try:
+            key = self._count_cache_key
+        except EmptyResultSet:
+            return 0
+        return cache.get_or_set(key, self.object_list.count, PAGE_COUNT_CACHE_TIMEOUT)
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            # The cached total may lag new rows; page() checks the rows themselves.
+            if int(number) < 1:
+                raise
+            return int(number)
+
+    def page(self, number):
+        if not isinstance(self.object_list, QuerySet):
+            return super().page(number)
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage(_('That page contains no results'))
+        seen = bottom + len(rows)
+        if len(rows) <= self.per_page or self.count < seen:
+            self._set_count(seen)
+        return self._get_page(rows[:self.per_page], number, self)
+
+    def _set_count(self, count):
+        if self.count == count:
+            return
+        self.count = count
+        self.__dict__.pop('num_pages', None)
+        try:
+            cache.set(self._count_cache_key, count, PAGE_COUNT_CACHE_TIMEOUT)
+        except EmptyResultSet:
+            pass
+
+
+class CachedCountPageNumberPagination(PageNumberPagination):
+    """Page number pagination whose total count is cached briefly."""
+
+    django_paginator_class = CachedCountPaginator
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Keyset pagination over ``created_at``, newest first.
+
+    Each page is a range scan on the ``created_at`` index instead of an
+    ``OFFSET`` that grows with page depth.
+    """
+
+    ordering = '-created_at'
+    page_size = 50
+
+
+class DateCursorPagination(CursorPagination):
+    """
+    Keyset pagination over every field of the view's ``ordering``.
+
+    DRF's cursor compares only the first ordering field and steps over ties
+    with an offset, which on a business date means re-reading every row of
+    the day. Here the primary key is appended as a final tie-breaker and the
+    cursor position holds all ordering values, so each page starts at a
+    row-value comparison such as ``(invoice_date, created_at, id) < (...)``.
+    The first field is also bounded on its own so a composite index on the
+    ordering can seek to the page. Ordering fields must not be nullable.
+    """
+
+    ordering = ('-created_at',)
+    page_size = 50
+
+    def get_ordering(self, request, queryset, view):
+        ordering = tuple(super().get_ordering(request, queryset, view))
+        pk_name = queryset.model._meta.pk.name
+        if ordering[-1].lstrip('-') not in ('pk', pk_name):
+            direction = '-' if ordering[-1].startswith('-') else ''
+            ordering += (f'{direction}{pk_name}',)
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            offset, reverse, current_position = 0, False, None
+        else:
+            offset, reverse, current_position = self.cursor
+
+        if reverse:
+            queryset = queryset.order_by(*_reverse_ordering(self.ordering))
+        else:
+            queryset = queryset.order_by(*self.ordering)
+        if current_position is not None:
+            queryset = queryset.filter(self._after_position(current_position, reverse))
+
+        # One extra row tells whether another page follows
+        results = list(queryset[offset:offset + self.page_size + 1])
+        self.page = results[:self.page_size]
+        if len(results) > len(self.page):
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            following_position = None
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = current_position is not None or offset > 0
+            self.has_previous = following_position is not None
+            self.next_position = current_position
+            self.previous_position = following_position
+        else:
+            self.has_next = following_position is not None
+            self.has_previous = current_position is not None or offset > 0
+            self.next_position = following_position
+            self.previous_position = current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+        return self.page
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip('-')
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            values.append(str(value))
+        return json.dumps(values)
+
+    def _after_position(self, position, reverse):
+        """Return the row-value comparison selecting the rows past ``position``."""
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message) from None
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        branches = []
+        equal = Q()
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') != reverse else 'gt'
+            branches.append(equal & Q(**{f'{name}__{lookup}': value}))
+            equal &= Q(**{name: value})
+        first = self.ordering[0]
+        bound = 'lte' if first.startswith('-') != reverse else 'gte'
+        return Q(**{f'{first.lstrip("-")}__{bound}': values[0]}) & reduce(or_, branches)
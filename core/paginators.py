@@ -0,0 +1,37 @@
+"""
+Custom paginators for the Farjad ERP system.
+
+This module contains paginators used by admin changelists on large tables.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that estimates the row count of unfiltered PostgreSQL tables.
+
+    Unfiltered changelists read the planner estimate from ``pg_class`` instead
+    of running ``SELECT COUNT(*)``. Filtered querysets, small tables and other
+    database backends fall back to the exact count.
+    """
+
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        """Return the estimated or exact number of objects."""
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.estimate_threshold:
+                return row[0]
+        return super().count
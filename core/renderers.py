@@ -0,0 +1,31 @@
+"""
+Custom renderers for the Farjad ERP system.
+
+This module contains the orjson-backed renderer used for API responses.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that encodes with orjson.
+
+    Types orjson does not handle the way DRF does, such as Decimal, datetimes
+    and lazy translations, are passed to DRF's encoder so the output matches
+    ``JSONRenderer``.
+    """
+
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_fallback_encoder.default, option=options)
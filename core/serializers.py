@@ -4,15 +4,53 @@ Core serializers for the Farjad ERP system.
 This module contains serializers for core functionality including contacts, companies, and addresses.
 """
 
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
+from rest_framework.settings import api_settings
 from .models import Contact, Company, Address, SystemConfiguration, AuditLog
 
 
+def violated_constraint_name(exc, names):
+    """Return which of ``names`` the database reported as violated by ``exc``."""
+    reported = getattr(getattr(exc.__cause__, 'diag', None), 'constraint_name', None)
+    if reported is not None:
+        return reported if reported in names else None
+    message = str(exc)
+    return next((name for name in names if name in message), None)
+
+
+class ConstraintErrorsMixin:
+    """
+    Report violated model constraints as validation errors.
+
+    Constraints declared in the model ``Meta`` use their violation message;
+    ``constraint_error_messages`` adds constraints created outside of it.
+    Any other ``IntegrityError`` propagates unchanged.
+    """
+
+    constraint_error_messages = {}
+
+    def save(self, **kwargs):
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError as exc:
+            messages = {
+                constraint.name: constraint.get_violation_error_message()
+                for constraint in self.Meta.model._meta.constraints
+            }
+            messages.update(self.constraint_error_messages)
+            name = violated_constraint_name(exc, messages)
+            if name is None:
+                raise
+            raise serializers.ValidationError({
+                api_settings.NON_FIELD_ERRORS_KEY: [messages[name]]
+            }) from exc
+
+
 class ContactSerializer(serializers.ModelSerializer):
     """Serializer for Contact model."""
     
-    full_name = serializers.ReadOnlyField()
-    
     class Meta:
         model = Contact
         fields = [
@@ -31,7 +69,7 @@ class ContactSerializer(serializers.ModelSerializer):
             'created_by',
             'updated_by',
         ]
-        read_only_fields = ['id', 'created_at', 'updated_at']
+        read_only_fields = ['id', 'full_name', 'created_at', 'updated_at']
 
 
 class CompanySerializer(serializers.ModelSerializer):
@@ -60,11 +98,12 @@ class CompanySerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
-class AddressSerializer(serializers.ModelSerializer):
+class AddressSerializer(ConstraintErrorsMixin, serializers.ModelSerializer):
     """Serializer for Address model."""
     
-    contact_name = serializers.CharField(source='contact.full_name', read_only=True)
-    company_name = serializers.CharField(source='company.name', read_only=True)
+    # Annotated onto the queryset by AddressViewSet
+    contact_name = serializers.CharField(read_only=True)
+    company_name = serializers.CharField(read_only=True)
     
     class Meta:
         model = Address
@@ -88,19 +127,6 @@ class AddressSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def validate(self, data):
-        """Validate that either contact or company is provided, but not both."""
-        contact = data.get('contact')
-        company = data.get('company')
-        
-        if not contact and not company:
-            raise serializers.ValidationError('Either contact or company must be specified.')
-        
-        if contact and company:
-            raise serializers.ValidationError('Cannot specify both contact and company.')
-        
-        return data
-
 
 class SystemConfigurationSerializer(serializers.ModelSerializer):
     """Serializer for SystemConfiguration model."""
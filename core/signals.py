@@ -0,0 +1,43 @@
+"""
+Core signal handlers for the Farjad ERP system.
+
+This module keeps cached contact and company statistics in sync with their rows
+and applies per-connection SQLite tuning.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import (
+    COMPANY_STATISTICS_CACHE_KEY,
+    CONTACT_STATISTICS_CACHE_KEY,
+    Company,
+    Contact,
+)
+
+
+@receiver(post_save, sender=Contact)
+@receiver(post_delete, sender=Contact)
+def invalidate_contact_statistics(sender, **kwargs):
+    """Drop cached contact statistics when a contact changes."""
+    cache.delete(CONTACT_STATISTICS_CACHE_KEY)
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_company_statistics(sender, **kwargs):
+    """Drop cached company statistics when a company changes."""
+    cache.delete(COMPANY_STATISTICS_CACHE_KEY)
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    """Run the configured PRAGMAs on every new SQLite connection."""
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        for pragma in getattr(settings, 'SQLITE_PRAGMAS', ()):
+            cursor.execute(f'PRAGMA {pragma}')
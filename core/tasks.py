@@ -0,0 +1,83 @@
+"""
+Core background tasks for the Farjad ERP system.
+
+This module contains Celery tasks that keep audit log writes off the request path,
+and the Redis buffer flush they share with the other apps.
+"""
+
+import json
+
+from celery import shared_task
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django_redis import get_redis_connection
+
+from .models import AuditLog
+
+AUDIT_LOG_BUFFER_KEY = 'core:audit_logs'
+BUFFER_FLUSH_LOCK_TIMEOUT = 300
+
+
+def flush_buffer(key, batch_size, insert):
+    """
+    Pass the JSON entries buffered in the Redis list ``key`` to ``insert`` in batches.
+
+    Each batch is moved atomically onto ``<key>:processing`` and deleted only
+    after ``insert`` returns, so a failed insert leaves the batch to be retried
+    first by the next flush instead of losing it. A lock keeps overlapping
+    flushes from inserting the same batch twice.
+    """
+    redis = get_redis_connection('default')
+    processing = f'{key}:processing'
+    lock = redis.lock(f'{key}:flush', timeout=BUFFER_FLUSH_LOCK_TIMEOUT)
+    if not lock.acquire(blocking=False):
+        return
+    try:
+        while True:
+            items = redis.lrange(processing, 0, -1)
+            if not items:
+                with redis.pipeline() as pipe:
+                    for _ in range(batch_size):
+                        pipe.lmove(key, processing)
+                    items = [item for item in pipe.execute() if item is not None]
+            if not items:
+                break
+            insert([json.loads(item) for item in items])
+            redis.delete(processing)
+            if len(items) < batch_size:
+                break
+    finally:
+        lock.release()
+
+
+def queue_audit_log(**fields):
+    """
+    Buffer an audit log entry for the next bulk insert.
+
+    The entry is pushed once the surrounding transaction commits, so rolled
+    back changes leave no trace. Buffered rows become visible after the next
+    flush and are stamped with the flush time. Buffered fields travel as JSON,
+    so pass ``user_id`` rather than a ``user`` instance.
+    """
+    if not settings.AUDIT_LOG_BUFFER:
+        AuditLog.objects.create(**fields)
+        return
+    payload = json.dumps(fields, cls=DjangoJSONEncoder)
+    transaction.on_commit(
+        lambda: get_redis_connection('default').rpush(AUDIT_LOG_BUFFER_KEY, payload)
+    )
+
+
+@shared_task(ignore_result=True)
+def flush_audit_logs():
+    """Bulk insert the audit log entries buffered in Redis."""
+    batch_size = settings.AUDIT_LOG_BUFFER_BATCH_SIZE
+    flush_buffer(
+        AUDIT_LOG_BUFFER_KEY,
+        batch_size,
+        lambda rows: AuditLog.objects.bulk_create(
+            [AuditLog(**row) for row in rows],
+            batch_size=batch_size,
+        ),
+    )
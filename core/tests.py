@@ -1,3 +1,272 @@
-from django.test import TestCase
+import json
+from collections import defaultdict
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from .models import Address, AuditLog, Company, Contact
+from .pagination import CachedCountPaginator
+from .serializers import AddressSerializer
+from .tasks import flush_buffer
+
+User = get_user_model()
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+def create_contact(index):
+    return Contact.objects.create(
+        first_name=f'First{index}',
+        last_name=f'Last{index}',
+        email=f'contact{index}@example.com',
+        contact_type='customer',
+    )
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CachedCountPaginatorTests(TestCase):
+    """The cached total must never hide rows from a page."""
+
+    def setUp(self):
+        cache.clear()
+        for index in range(3):
+            create_contact(index)
+
+    def paginator(self):
+        return CachedCountPaginator(Contact.objects.order_by('pk'), 2)
+
+    def test_last_page_includes_rows_added_after_count_was_cached(self):
+        self.assertEqual(self.paginator().count, 3)
+        create_contact(3)
+        page = self.paginator().page(2)
+        self.assertEqual(len(page.object_list), 2)
+        self.assertEqual(page.paginator.count, 4)
+        self.assertEqual(self.paginator().count, 4)
+
+    def test_page_beyond_stale_count_is_served(self):
+        self.assertEqual(self.paginator().count, 3)
+        create_contact(3)
+        create_contact(4)
+        paginator = self.paginator()
+        self.assertTrue(paginator.page(2).has_next())
+        self.assertEqual(len(paginator.page(3).object_list), 1)
+
+    def test_empty_page_beyond_rows_is_rejected(self):
+        with self.assertRaises(EmptyPage):
+            self.paginator().page(3)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ContactListPaginationTests(TestCase):
+    """The contact list reports new rows while its count is cached."""
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user(
+                username='staff', email='staff@example.com', password='pw',
+                first_name='Staff', last_name='User',
+            )
+        )
+
+    def test_new_contact_appears_in_count_and_results(self):
+        create_contact(0)
+        create_contact(1)
+        response = self.client.get('/api/core/contacts/')
+        self.assertEqual(response.data['count'], 2)
+        create_contact(2)
+        response = self.client.get('/api/core/contacts/')
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(len(response.data['results']), 3)
+
+
+class AuditLogConditionalGetTests(TestCase):
+    """Audit log ETags change with the newest entry and the requested URL."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user(
+                username='auditor', email='auditor@example.com', password='pw',
+                first_name='Audit', last_name='User',
+            )
+        )
+        AuditLog.objects.create(action='create', model_name='Contact', object_repr='First0 Last0')
+
+    def test_unchanged_list_answers_not_modified(self):
+        response = self.client.get('/api/core/audit-logs/')
+        self.assertEqual(response.status_code, 200)
+        response = self.client.get('/api/core/audit-logs/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_filtered_list_does_not_reuse_unfiltered_etag(self):
+        etag = self.client.get('/api/core/audit-logs/')['ETag']
+        response = self.client.get(
+            '/api/core/audit-logs/', {'model_name': 'Invoice'}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['results'], [])
+
+    def test_new_entry_changes_etag(self):
+        etag = self.client.get('/api/core/audit-logs/')['ETag']
+        AuditLog.objects.create(action='update', model_name='Contact', object_repr='First0 Last0')
+        response = self.client.get('/api/core/audit-logs/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data['results']), 2)
+
+
+class AddressSerializerConstraintTests(TestCase):
+    """Address constraint violations become validation errors; others do not."""
+
+    def setUp(self):
+        self.contact = create_contact(0)
+        self.company = Company.objects.create(name='Farjad Co', company_type='customer')
+
+    def address_data(self, **owners):
+        return {
+            'address_type': 'billing',
+            'street_address': '1 Main St',
+            'city': 'Tehran',
+            'state': 'Tehran',
+            'postal_code': '12345',
+            **owners,
+        }
+
+    def test_contact_and_company_together_is_a_validation_error(self):
+        serializer = AddressSerializer(
+            data=self.address_data(contact=self.contact.pk, company=self.company.pk)
+        )
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with self.assertRaises(ValidationError) as raised:
+            serializer.save()
+        self.assertEqual(
+            raised.exception.detail['non_field_errors'],
+            ['Specify either a contact or a company, but not both.'],
+        )
+        self.assertFalse(Address.objects.exists())
+
+    def test_unrelated_integrity_error_is_not_rewritten(self):
+        serializer = AddressSerializer(data=self.address_data(contact=self.contact.pk))
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        with mock.patch.object(Address, 'save', side_effect=IntegrityError('other failure')):
+            with self.assertRaises(IntegrityError):
+                serializer.save()
+
+
+class AuditLogMixinTests(TestCase):
+    """Writes through audited viewsets leave an audit log entry."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='clerk', email='clerk@example.com', password='pw',
+            first_name='Audit', last_name='Clerk',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_create_update_and_delete_are_logged(self):
+        response = self.client.post('/api/core/contacts/', {
+            'first_name': 'Jane', 'last_name': 'Doe', 'email': 'jane@example.com', 'contact_type': 'customer',
+        }, format='json', HTTP_USER_AGENT='tests')
+        self.assertEqual(response.status_code, 201)
+        contact_id = str(response.data['id'])
+        self.client.patch(f'/api/core/contacts/{contact_id}/', {'notes': 'Prefers email'}, format='json')
+        self.client.delete(f'/api/core/contacts/{contact_id}/')
+
+        logs = list(AuditLog.objects.order_by('pk'))
+        self.assertEqual([log.action for log in logs], ['create', 'update', 'delete'])
+        for log in logs:
+            self.assertEqual(log.user, self.user)
+            self.assertEqual(log.model_name, 'contact')
+            self.assertEqual(log.object_id, contact_id)
+            self.assertEqual(log.ip_address, '127.0.0.1')
+        self.assertEqual(logs[0].user_agent, 'tests')
+        self.assertEqual(logs[0].changes['last_name'], 'Doe')
+        self.assertEqual(logs[1].changes, {'notes': 'Prefers email'})
+        self.assertEqual(logs[2].changes, {})
+
+
+class FakeRedis:
+    """The slice of the Redis list API that flush_buffer uses."""
+
+    def __init__(self):
+        self.lists = defaultdict(list)
+        self.locked = False
+
+    def rpush(self, key, *values):
+        self.lists[key].extend(values)
+
+    def lrange(self, key, start, end):
+        return list(self.lists[key])
+
+    def lmove(self, source, destination):
+        if not self.lists[source]:
+            return None
+        item = self.lists[source].pop(0)
+        self.lists[destination].append(item)
+        return item
+
+    def delete(self, key):
+        self.lists.pop(key, None)
+
+    def pipeline(self):
+        redis = self
+
+        class Pipeline:
+            def __init__(self):
+                self.calls = []
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def lmove(self, *args):
+                self.calls.append(args)
+
+            def execute(self):
+                return [redis.lmove(*args) for args in self.calls]
+
+        return Pipeline()
+
+    def lock(self, name, timeout):
+        return mock.Mock(acquire=mock.Mock(return_value=not self.locked))
+
+
+class FlushBufferTests(TestCase):
+    """Buffered entries leave Redis only once they are inserted."""
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch('core.tasks.get_redis_connection', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.redis.rpush('buffer', *(json.dumps({'n': n}) for n in range(5)))
+
+    def test_batches_are_inserted_in_order(self):
+        batches = []
+        flush_buffer('buffer', 2, batches.append)
+        self.assertEqual(batches, [[{'n': 0}, {'n': 1}], [{'n': 2}, {'n': 3}], [{'n': 4}]])
+        self.assertFalse(any(self.redis.lists.values()))
+
+    def test_failed_insert_keeps_the_batch_for_the_next_flush(self):
+        with self.assertRaises(IntegrityError):
+            flush_buffer('buffer', 2, mock.Mock(side_effect=IntegrityError))
+        self.assertEqual(len(self.redis.lists['buffer:processing']), 2)
+        batches = []
+        flush_buffer('buffer', 2, batches.append)
+        self.assertEqual([row['n'] for batch in batches for row in batch], [0, 1, 2, 3, 4])
+
+    def test_overlapping_flush_does_nothing(self):
+        self.redis.locked = True
+        insert = mock.Mock()
+        flush_buffer('buffer', 2, insert)
+        insert.assert_not_called()
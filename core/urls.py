@@ -10,8 +10,10 @@ router = DefaultRouter()
 router.register(r'contacts', views.ContactViewSet)
 router.register(r'companies', views.CompanyViewSet)
 router.register(r'addresses', views.AddressViewSet)
+router.register(r'audit-logs', views.AuditLogViewSet)
 
 urlpatterns = [
     path('', include(router.urls)),
     path('health/', views.health_check, name='health-check'),
+    path('ready/', views.readiness_check, name='readiness-check'),
 ]
@@ -0,0 +1,13 @@
+"""
+Utility functions for the Farjad ERP system.
+
+This module contains helpers shared by the models of every app.
+"""
+
+import secrets
+import time
+
+
+def time_ordered_id():
+    """Return a hex id of a 48-bit millisecond timestamp followed by 32 random bits."""
+    return f'{time.time_ns() // 1_000_000:012X}{secrets.token_hex(4).upper()}'
@@ -0,0 +1,14 @@
+"""
+Validators for the Farjad ERP system.
+
+This module contains field validators shared by the models of every app.
+"""
+
+from django.core.validators import RegexValidator
+from django.utils.translation import gettext_lazy as _
+
+PHONE_PATTERN = r'^\+?1?\d{9,15}$'
+PHONE_MESSAGE = _("Phone number must be entered in the format: '+999999999'. Up to 15 digits allowed.")
+
+# Shared by every phone field so the pattern is compiled once per process
+PHONE_VALIDATOR = RegexValidator(regex=PHONE_PATTERN, message=PHONE_MESSAGE)
@@ -4,6 +4,15 @@ Core views for the Farjad ERP system.
 This module contains views for core functionality including contacts, companies, and addresses.
 """
 
+import hashlib
+
+from django.core.cache import cache
+from django.db import DatabaseError, connections
+from django.db.models import Count, F, Q
+from django.http import JsonResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import etag, require_GET
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -12,7 +21,21 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
-from .models import Contact, Company, Address, SystemConfiguration, AuditLog
+from .mixins import AuditLogMixin, AutoPrefetchMixin
+from .filters import ContactFilter, CompanyFilter, AddressFilter, SystemConfigurationFilter, AuditLogFilter
+from .models import (
+    COMPANY_STATISTICS_CACHE_KEY,
+    CONTACT_STATISTICS_CACHE_KEY,
+    STATISTICS_CACHE_TIMEOUT,
+    Contact,
+    ContactType,
+    Company,
+    CompanyType,
+    Address,
+    SystemConfiguration,
+    AuditLog,
+)
+from .pagination import CreatedAtCursorPagination
 from .serializers import (
     ContactSerializer,
     CompanySerializer,
@@ -21,6 +44,16 @@ from .serializers import (
     AuditLogSerializer,
 )
 
+# Per-type counters for the statistics actions, built once at import
+_CONTACT_TYPE_COUNTS = {
+    contact_type: Count('id', filter=Q(contact_type=contact_type))
+    for contact_type in ContactType.values
+}
+_COMPANY_TYPE_COUNTS = {
+    company_type: Count('id', filter=Q(company_type=company_type))
+    for company_type in CompanyType.values
+}
+
 
 @extend_schema_view(
     list=extend_schema(summary="List contacts", description="Retrieve a list of all contacts"),
@@ -30,14 +63,14 @@ from .serializers import (
     partial_update=extend_schema(summary="Partially update contact", description="Partially update a specific contact"),
     destroy=extend_schema(summary="Delete contact", description="Delete a specific contact"),
 )
-class ContactViewSet(viewsets.ModelViewSet):
+class ContactViewSet(AuditLogMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing contacts."""
     
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['contact_type', 'is_active']
+    filterset_class = ContactFilter
     search_fields = ['first_name', 'last_name', 'email', 'phone']
     ordering_fields = ['first_name', 'last_name', 'created_at']
     ordering = ['last_name', 'first_name']
@@ -46,15 +79,22 @@ class ContactViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         """Get contact statistics."""
+        stats = cache.get(CONTACT_STATISTICS_CACHE_KEY)
+        if stats is not None:
+            return Response(stats)
+        counts = Contact.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            inactive=Count('id', filter=Q(is_active=False)),
+            **_CONTACT_TYPE_COUNTS,
+        )
         stats = {
-            'total_contacts': Contact.objects.count(),
-            'active_contacts': Contact.objects.filter(is_active=True).count(),
-            'inactive_contacts': Contact.objects.filter(is_active=False).count(),
-            'by_type': {
-                contact_type: Contact.objects.filter(contact_type=contact_type).count()
-                for contact_type, _ in Contact.CONTACT_TYPES
-            }
+            'total_contacts': counts.pop('total'),
+            'active_contacts': counts.pop('active'),
+            'inactive_contacts': counts.pop('inactive'),
+            'by_type': counts,
         }
+        cache.set(CONTACT_STATISTICS_CACHE_KEY, stats, STATISTICS_CACHE_TIMEOUT)
         return Response(stats)
 
 
@@ -66,14 +106,14 @@ class ContactViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update company", description="Partially update a specific company"),
     destroy=extend_schema(summary="Delete company", description="Delete a specific company"),
 )
-class CompanyViewSet(viewsets.ModelViewSet):
+class CompanyViewSet(AuditLogMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing companies."""
     
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['company_type', 'is_active']
+    filterset_class = CompanyFilter
     search_fields = ['name', 'legal_name', 'email', 'tax_id']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
@@ -82,15 +122,22 @@ class CompanyViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def statistics(self, request):
         """Get company statistics."""
+        stats = cache.get(COMPANY_STATISTICS_CACHE_KEY)
+        if stats is not None:
+            return Response(stats)
+        counts = Company.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(is_active=True)),
+            inactive=Count('id', filter=Q(is_active=False)),
+            **_COMPANY_TYPE_COUNTS,
+        )
         stats = {
-            'total_companies': Company.objects.count(),
-            'active_companies': Company.objects.filter(is_active=True).count(),
-            'inactive_companies': Company.objects.filter(is_active=False).count(),
-            'by_type': {
-                company_type: Company.objects.filter(company_type=company_type).count()
-                for company_type, _ in Company.COMPANY_TYPES
-            }
+            'total_companies': counts.pop('total'),
+            'active_companies': counts.pop('active'),
+            'inactive_companies': counts.pop('inactive'),
+            'by_type': counts,
         }
+        cache.set(COMPANY_STATISTICS_CACHE_KEY, stats, STATISTICS_CACHE_TIMEOUT)
         return Response(stats)
 
 
@@ -102,18 +149,29 @@ class CompanyViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update address", description="Partially update a specific address"),
     destroy=extend_schema(summary="Delete address", description="Delete a specific address"),
 )
-class AddressViewSet(viewsets.ModelViewSet):
+class AddressViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing addresses."""
     
-    queryset = Address.objects.all()
+    queryset = Address.objects.annotate(
+        contact_name=F('contact__full_name'),
+        company_name=F('company__name'),
+    )
     serializer_class = AddressSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['address_type', 'is_primary', 'contact', 'company']
+    filterset_class = AddressFilter
     search_fields = ['street_address', 'city', 'state', 'postal_code']
     ordering_fields = ['city', 'created_at']
     ordering = ['city', 'street_address']
 
+    def perform_create(self, serializer):
+        super().perform_create(serializer)
+        serializer.instance = self.get_queryset().get(pk=serializer.instance.pk)
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        serializer.instance = self.get_queryset().get(pk=serializer.instance.pk)
+
 
 @extend_schema_view(
     list=extend_schema(summary="List system configurations", description="Retrieve a list of all system configurations"),
@@ -123,40 +181,90 @@ class AddressViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update system configuration", description="Partially update a specific system configuration"),
     destroy=extend_schema(summary="Delete system configuration", description="Delete a specific system configuration"),
 )
-class SystemConfigurationViewSet(viewsets.ModelViewSet):
+class SystemConfigurationViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing system configurations."""
     
     queryset = SystemConfiguration.objects.all()
     serializer_class = SystemConfigurationSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['is_active']
+    filterset_class = SystemConfigurationFilter
     search_fields = ['key', 'description']
     ordering_fields = ['key', 'created_at']
     ordering = ['key']
 
 
+def audit_log_etag(request, *args, **kwargs):
+    """Version audit log responses by the newest entry and the requested URL."""
+    latest = AuditLog.objects.order_by('-created_at').values_list('pk', 'created_at').first()
+    if latest is None:
+        version = 'empty'
+    else:
+        pk, created_at = latest
+        version = f'{pk}-{created_at.timestamp()}'
+    # Filters, search, ordering and the cursor all select different rows
+    path = hashlib.md5(request.get_full_path().encode(), usedforsecurity=False).hexdigest()
+    return f'{version}-{path}'
+
+
 @extend_schema_view(
     list=extend_schema(summary="List audit logs", description="Retrieve a list of all audit logs"),
     retrieve=extend_schema(summary="Get audit log", description="Retrieve a specific audit log"),
 )
-class AuditLogViewSet(viewsets.ReadOnlyModelViewSet):
+@method_decorator(cache_control(private=True, must_revalidate=True), name='list')
+@method_decorator(etag(audit_log_etag), name='list')
+@method_decorator(cache_control(private=True, must_revalidate=True), name='retrieve')
+@method_decorator(etag(audit_log_etag), name='retrieve')
+class AuditLogViewSet(AutoPrefetchMixin, viewsets.ReadOnlyModelViewSet):
     """ViewSet for viewing audit logs."""
     
     queryset = AuditLog.objects.all()
     serializer_class = AuditLogSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['action', 'model_name', 'user']
+    filterset_class = AuditLogFilter
     search_fields = ['object_repr', 'ip_address']
     ordering_fields = ['created_at']
     ordering = ['-created_at']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Skip the bookkeeping columns and everything on the user but the name
+            queryset = queryset.only(
+                'id',
+                'user__full_name',
+                'action',
+                'model_name',
+                'object_id',
+                'object_repr',
+                'changes',
+                'ip_address',
+                'user_agent',
+                'created_at',
+            )
+        return queryset
+
 
+@require_GET
+@cache_control(no_store=True)
 def health_check(request):
-    """Health check endpoint."""
-    return Response({
+    """Liveness check endpoint; never touches the database."""
+    return JsonResponse({
         'status': 'healthy',
         'message': 'Farjad ERP API is running',
         'version': '1.0.0'
-    })
\ No newline at end of file
+    })
+
+
+@require_GET
+@cache_control(no_store=True)
+def readiness_check(request):
+    """Readiness check endpoint; verifies the database answers."""
+    try:
+        with connections['default'].cursor() as cursor:
+            cursor.execute('SELECT 1')
+    except DatabaseError:
+        return JsonResponse({'status': 'unavailable', 'database': 'unreachable'}, status=503)
+    return JsonResponse({'status': 'ready', 'database': 'ok'})
@@ -0,0 +1,15 @@
+"""
+Celery configuration for farjad project.
+
+Tasks are discovered from the ``tasks`` module of each installed app.
+"""
+
+import os
+
+from celery import Celery
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'farjad.settings')
+
+app = Celery('farjad')
+app.config_from_object('django.conf:settings', namespace='CELERY')
+app.autodiscover_tasks()
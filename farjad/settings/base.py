@@ -61,9 +61,11 @@ MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'accounts.middleware.ClientIPMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'allauth.account.middleware.AccountMiddleware',
@@ -163,7 +165,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.CachedCountPageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -172,7 +174,7 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -257,6 +259,10 @@ SPECTACULAR_SETTINGS = {
     'SORT_OPERATIONS': False,
 }
 
+# Static path of a schema pre-generated with `manage.py spectacular`;
+# when unset the schema is introspected on every request
+API_SCHEMA_STATIC_FILE = None
+
 # Logging
 LOGGING = {
     'version': 1,
@@ -303,6 +309,28 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'flush-user-sessions': {
+        'task': 'accounts.tasks.flush_user_sessions',
+        'schedule': 1.0,
+    },
+    'flush-audit-logs': {
+        'task': 'core.tasks.flush_audit_logs',
+        'schedule': 1.0,
+    },
+    'refresh-account-monthly-balances': {
+        'task': 'finance.tasks.refresh_account_monthly_balances',
+        'schedule': 15 * 60.0,
+    },
+}
+
+# Login sessions are buffered in Redis and bulk inserted by Celery beat
+USER_SESSION_BUFFER = config('USER_SESSION_BUFFER', default=True, cast=bool)
+USER_SESSION_BUFFER_BATCH_SIZE = 500
+
+# Audit logs are buffered in Redis and bulk inserted by Celery beat
+AUDIT_LOG_BUFFER = config('AUDIT_LOG_BUFFER', default=True, cast=bool)
+AUDIT_LOG_BUFFER_BATCH_SIZE = config('AUDIT_BULK_BATCH_SIZE', default=1000, cast=int)
 
 # Cache
 CACHES = {
@@ -2,6 +2,8 @@
 Development settings for Farjad project.
 """
 
+from importlib.util import find_spec
+
 from .base import *
 
 # SECURITY WARNING: don't run with debug turned on in production!
@@ -18,6 +20,15 @@ DATABASES = {
     }
 }
 
+# Applied to each SQLite connection by core.signals. WAL mode keeps
+# db.sqlite3-wal and db.sqlite3-shm files next to the database.
+SQLITE_PRAGMAS = [
+    'journal_mode=WAL',
+    'synchronous=NORMAL',
+    'temp_store=MEMORY',
+    'mmap_size=268435456',
+]
+
 # CORS settings for development
 CORS_ALLOW_ALL_ORIGINS = True
 
@@ -35,6 +46,18 @@ CACHES = {
     }
 }
 
+# Run Celery tasks inline, no broker required
+CELERY_TASK_ALWAYS_EAGER = True
+USER_SESSION_BUFFER = False
+AUDIT_LOG_BUFFER = False
+
+# Request and SQL profiling with django-silk (pip install -e '.[dev]')
+if find_spec('silk') is not None:
+    INSTALLED_APPS += ['silk']
+    MIDDLEWARE += ['silk.middleware.SilkyMiddleware']
+    SILKY_PYTHON_PROFILER = True
+    SILKY_META = True
+
 # Session
 SESSION_ENGINE = 'django.contrib.sessions.backends.db'
 
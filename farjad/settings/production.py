@@ -9,6 +9,13 @@ DEBUG = False
 
 ALLOWED_HOSTS = config('ALLOWED_HOSTS', cast=lambda v: [s.strip() for s in v.split(',')])
 
+# Compress API responses; placed before ConditionalGetMiddleware so ETags
+# are computed on the uncompressed body
+MIDDLEWARE.insert(
+    MIDDLEWARE.index('django.middleware.http.ConditionalGetMiddleware'),
+    'django.middleware.gzip.GZipMiddleware',
+)
+
 # Database
 DATABASES = {
     'default': {
@@ -21,6 +28,12 @@ DATABASES = {
         'OPTIONS': {
             'sslmode': 'require',
         },
+        # Reuse connections across requests; set DB_CONN_MAX_AGE=0 when
+        # pgbouncer owns the pool in transaction mode
+        'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+        'CONN_HEALTH_CHECKS': True,
+        # Server-side cursors do not survive transaction-mode pooling
+        'DISABLE_SERVER_SIDE_CURSORS': config('DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool),
     }
 }
 
@@ -53,8 +66,18 @@ LOGGING['handlers']['file']['filename'] = '/var/log/farjad/django.log'
 LOGGING['loggers']['django']['level'] = 'WARNING'
 LOGGING['loggers']['farjad']['level'] = 'INFO'
 
-# Static files
-STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+# Static and media file storage
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'whitenoise.storage.CompressedManifestStaticFilesStorage',
+    },
+}
+
+# OpenAPI schema generated at build time, see Dockerfile
+API_SCHEMA_STATIC_FILE = config('API_SCHEMA_STATIC_FILE', default='schema.yml')
 
-# Media files
-DEFAULT_FILE_STORAGE = 'django.core.files.storage.FileSystemStorage'
+# Serve only hashed file names, which WhiteNoise caches forever
+WHITENOISE_KEEP_ONLY_HASHED_FILES = True
@@ -40,6 +40,11 @@ CACHES = {
     }
 }
 
+# Run Celery tasks inline, no broker required
+CELERY_TASK_ALWAYS_EAGER = True
+USER_SESSION_BUFFER = False
+AUDIT_LOG_BUFFER = False
+
 # Disable logging during tests
 LOGGING_CONFIG = None
 
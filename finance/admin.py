@@ -5,6 +5,8 @@ This module contains admin configurations for invoice, payment, and financial tr
 """
 
 from django.contrib import admin
+from django.db.models import BooleanField, Case, Q, When
+from django.utils import timezone
 from django.utils.html import format_html
 from .models import Account, Invoice, InvoiceItem, Payment, Transaction, Expense
 
@@ -24,7 +26,7 @@ class AccountAdmin(admin.ModelAdmin):
     list_filter = [
         'account_type',
         'is_active',
-        'parent',
+        ('parent', admin.RelatedOnlyFieldListFilter),
         'created_at',
     ]
     search_fields = [
@@ -37,6 +39,8 @@ class AccountAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['code']
+    list_select_related = ['parent']
+    autocomplete_fields = ['parent']
     
     fieldsets = (
         ('Account Information', {
@@ -61,7 +65,7 @@ class InvoiceAdmin(admin.ModelAdmin):
         'total_amount',
         'invoice_date',
         'due_date',
-        'is_overdue',
+        'overdue',
     ]
     list_filter = [
         'status',
@@ -84,6 +88,29 @@ class InvoiceAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['-invoice_date']
+    list_select_related = ['customer']
+    autocomplete_fields = ['customer', 'customer_company']
+    raw_id_fields = ['created_by']
+    
+    def get_queryset(self, request):
+        """Compute the overdue flag in the database."""
+        return super().get_queryset(request).annotate(
+            overdue=Case(
+                When(
+                    ~Q(status__in=['paid', 'cancelled']) & Q(due_date__lt=timezone.now().date()),
+                    then=True,
+                ),
+                default=False,
+                output_field=BooleanField(),
+            )
+        )
+    
+    def overdue(self, obj):
+        """Show whether the invoice is overdue."""
+        return obj.overdue
+    overdue.short_description = 'Is overdue'
+    overdue.boolean = True
+    overdue.admin_order_field = 'overdue'
     
     fieldsets = (
         ('Basic Information', {
@@ -132,6 +159,8 @@ class InvoiceItemAdmin(admin.ModelAdmin):
         'description',
     ]
     ordering = ['invoice', 'id']
+    list_select_related = ['invoice__customer']
+    autocomplete_fields = ['invoice']
     
     fieldsets = (
         ('Item Information', {
@@ -171,6 +200,9 @@ class PaymentAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['-payment_date']
+    list_select_related = ['invoice__customer']
+    autocomplete_fields = ['invoice']
+    raw_id_fields = ['created_by']
     
     fieldsets = (
         ('Payment Information', {
@@ -220,6 +252,9 @@ class TransactionAdmin(admin.ModelAdmin):
         'created_at',
     ]
     ordering = ['-transaction_date']
+    list_select_related = ['debit_account', 'credit_account']
+    autocomplete_fields = ['debit_account', 'credit_account']
+    raw_id_fields = ['created_by']
     
     fieldsets = (
         ('Transaction Information', {
@@ -270,6 +305,8 @@ class ExpenseAdmin(admin.ModelAdmin):
         'created_at',
     ]
     ordering = ['-expense_date']
+    autocomplete_fields = ['account', 'vendor']
+    raw_id_fields = ['approved_by', 'created_by']
     
     fieldsets = (
         ('Expense Information', {
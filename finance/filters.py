@@ -0,0 +1,41 @@
+"""
+Finance filters for the Farjad ERP system.
+
+This module contains the FilterSets for accounts, invoices, payments and transactions.
+"""
+
+from django_filters.rest_framework import FilterSet
+
+from .models import Account, Invoice, Payment, Transaction
+
+
+class AccountFilter(FilterSet):
+    """Filters for the account list."""
+
+    class Meta:
+        model = Account
+        fields = ['account_type', 'is_active']
+
+
+class InvoiceFilter(FilterSet):
+    """Filters for the invoice list."""
+
+    class Meta:
+        model = Invoice
+        fields = ['status', 'invoice_type', 'customer']
+
+
+class PaymentFilter(FilterSet):
+    """Filters for the payment list."""
+
+    class Meta:
+        model = Payment
+        fields = ['status', 'payment_method', 'invoice']
+
+
+class TransactionFilter(FilterSet):
+    """Filters for the transaction list."""
+
+    class Meta:
+        model = Transaction
+        fields = ['debit_account', 'credit_account']
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:12
+
+from django.db import migrations, models
+import finance.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='expense',
+            name='expense_number',
+            field=models.CharField(default=finance.models.generate_expense_number, max_length=50, unique=True, verbose_name='Expense number'),
+        ),
+        migrations.AlterField(
+            model_name='invoice',
+            name='invoice_number',
+            field=models.CharField(default=finance.models.generate_invoice_number, max_length=50, unique=True, verbose_name='Invoice number'),
+        ),
+        migrations.AlterField(
+            model_name='payment',
+            name='payment_number',
+            field=models.CharField(default=finance.models.generate_payment_number, max_length=50, unique=True, verbose_name='Payment number'),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='transaction_number',
+            field=models.CharField(default=finance.models.generate_transaction_number, max_length=50, unique=True, verbose_name='Transaction number'),
+        ),
+    ]
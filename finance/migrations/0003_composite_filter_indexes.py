@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0002_time_ordered_numbers'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='invoice',
+            name='finance_inv_custome_8c51bd_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='invoice',
+            name='finance_inv_status_d9b47e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='finance_pay_invoice_122c17_idx',
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(condition=models.Q(('is_approved', False)), fields=['expense_date'], name='expense_pending_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['customer', '-invoice_date'], name='invoice_customer_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['status', 'due_date'], name='invoice_status_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(condition=models.Q(('status__in', ['sent', 'overdue'])), fields=['due_date'], name='invoice_open_due_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['invoice', 'status'], name='payment_invoice_status_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:14
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0003_composite_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AccountMonthlyBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.DateField(verbose_name='Period')),
+                ('debit_total', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Debit total')),
+                ('credit_total', models.DecimalField(decimal_places=2, max_digits=15, verbose_name='Credit total')),
+                ('account', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='finance.account', verbose_name='Account')),
+            ],
+            options={
+                'verbose_name': 'Account Monthly Balance',
+                'verbose_name_plural': 'Account Monthly Balances',
+                'db_table': 'finance_account_monthly_balance',
+                'ordering': ['account', 'period'],
+                'managed': False,
+            },
+        ),
+        PostgreSQLRunSQL(
+            sql="""
+                CREATE MATERIALIZED VIEW finance_account_monthly_balance AS
+                SELECT row_number() OVER (ORDER BY account_id, period) AS id, totals.*
+                FROM (
+                    SELECT entry.account_id,
+                           date_trunc('month', entry.transaction_date)::date AS period,
+                           SUM(entry.debit) AS debit_total,
+                           SUM(entry.credit) AS credit_total
+                    FROM (
+                        SELECT debit_account_id AS account_id, transaction_date, amount AS debit, 0 AS credit
+                        FROM finance_transaction
+                        UNION ALL
+                        SELECT credit_account_id, transaction_date, 0, amount
+                        FROM finance_transaction
+                    ) AS entry
+                    GROUP BY entry.account_id, period
+                ) AS totals;
+                CREATE UNIQUE INDEX finance_account_monthly_balance_uniq
+                    ON finance_account_monthly_balance (account_id, period);
+            """,
+            reverse_sql='DROP MATERIALIZED VIEW finance_account_monthly_balance;',
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0004_account_monthly_balance'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='payment',
+            options={'ordering': ['-payment_date', '-created_at'], 'verbose_name': 'Payment', 'verbose_name_plural': 'Payments'},
+        ),
+        migrations.RemoveIndex(
+            model_name='invoice',
+            name='finance_inv_invoice_6c3844_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='finance_pay_payment_72f761_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='transaction',
+            name='finance_tra_transac_0cc58e_idx',
+        ),
+        migrations.AddIndex(
+            model_name='invoice',
+            index=models.Index(fields=['-invoice_date', '-created_at', '-id'], name='invoice_date_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['-payment_date', '-created_at', '-id'], name='payment_date_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['-transaction_date', '-created_at', '-id'], name='transaction_date_created_idx'),
+        ),
+    ]
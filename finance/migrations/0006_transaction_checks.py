@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0005_date_created_cursor_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='transaction',
+            constraint=models.CheckConstraint(check=models.Q(('debit_account', models.F('credit_account')), _negated=True), name='transaction_distinct_accounts', violation_error_message='Debit and credit accounts must differ.'),
+        ),
+        migrations.AddConstraint(
+            model_name='transaction',
+            constraint=models.CheckConstraint(check=models.Q(('amount__gt', 0)), name='transaction_positive_amount', violation_error_message='Amount must be greater than zero.'),
+        ),
+    ]
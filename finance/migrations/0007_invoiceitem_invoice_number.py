@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_invoice_number(apps, schema_editor):
+    Invoice = apps.get_model('finance', 'Invoice')
+    InvoiceItem = apps.get_model('finance', 'InvoiceItem')
+    InvoiceItem.objects.update(
+        invoice_number=Subquery(
+            Invoice.objects.filter(pk=OuterRef('invoice_id')).values('invoice_number')[:1]
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('finance', '0006_transaction_checks'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='invoiceitem',
+            name='invoice_number',
+            field=models.CharField(default='', editable=False, max_length=50, verbose_name='Invoice number'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_invoice_number, migrations.RunPython.noop),
+    ]
@@ -5,14 +5,38 @@ This module contains invoice, payment, and financial transaction models.
 """
 
 from django.db import models
+from django.db.models.expressions import RawSQL
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
 
+from core.utils import time_ordered_id
+
 User = get_user_model()
 
 
+def generate_invoice_number():
+    """Return a new unique invoice number."""
+    return f'INV-{time_ordered_id()}'
+
+
+def generate_payment_number():
+    """Return a new unique payment number."""
+    return f'PAY-{time_ordered_id()}'
+
+
+def generate_transaction_number():
+    """Return a new unique transaction number."""
+    return f'TXN-{time_ordered_id()}'
+
+
+def generate_expense_number():
+    """Return a new unique expense number."""
+    return f'EXP-{time_ordered_id()}'
+
+
 class Account(models.Model):
     """Chart of accounts model."""
     
@@ -53,6 +77,32 @@ class Account(models.Model):
     def __str__(self):
         return f"{self.code} - {self.name}"
 
+    def get_descendants(self, include_self=False):
+        """Return the whole subtree below this account in a single query."""
+        # Literal SQL: only the root id is interpolated, and as a parameter
+        subtree = RawSQL(
+            'WITH RECURSIVE subtree(id) AS ('
+            'SELECT id FROM finance_account WHERE parent_id = %s '
+            'UNION SELECT a.id FROM finance_account a JOIN subtree ON a.parent_id = subtree.id'
+            ') SELECT id FROM subtree',
+            [self.pk],
+        )
+        condition = models.Q(pk__in=subtree)
+        if include_self:
+            condition |= models.Q(pk=self.pk)
+        return Account.objects.filter(condition)
+
+    def get_ancestors(self):
+        """Return the chain of parent accounts in a single query."""
+        ancestors = RawSQL(
+            'WITH RECURSIVE ancestors(id, parent_id) AS ('
+            'SELECT id, parent_id FROM finance_account WHERE id = %s '
+            'UNION SELECT a.id, a.parent_id FROM finance_account a JOIN ancestors ON a.id = ancestors.parent_id'
+            ') SELECT parent_id FROM ancestors WHERE parent_id IS NOT NULL',
+            [self.pk],
+        )
+        return Account.objects.filter(pk__in=ancestors)
+
 
 class Invoice(models.Model):
     """Invoice model for billing customers."""
@@ -73,7 +123,9 @@ class Invoice(models.Model):
     ]
     
     # Basic Information
-    invoice_number = models.CharField(_('Invoice number'), max_length=50, unique=True)
+    invoice_number = models.CharField(
+        _('Invoice number'), max_length=50, unique=True, default=generate_invoice_number
+    )
     invoice_type = models.CharField(_('Invoice type'), max_length=20, choices=INVOICE_TYPES, default='sale')
     status = models.CharField(_('Status'), max_length=20, choices=STATUS_CHOICES, default='draft')
     
@@ -156,35 +208,57 @@ class Invoice(models.Model):
         ordering = ['-invoice_date', '-created_at']
         indexes = [
             models.Index(fields=['invoice_number']),
-            models.Index(fields=['customer']),
-            models.Index(fields=['status']),
-            models.Index(fields=['invoice_date']),
+            models.Index(fields=['customer', '-invoice_date'], name='invoice_customer_date_idx'),
+            models.Index(fields=['status', 'due_date'], name='invoice_status_due_idx'),
+            models.Index(fields=['-invoice_date', '-created_at', '-id'], name='invoice_date_created_idx'),
             models.Index(fields=['due_date']),
+            models.Index(
+                fields=['due_date'],
+                condition=models.Q(status__in=['sent', 'overdue']),
+                name='invoice_open_due_idx',
+            ),
         ]
 
     def __str__(self):
         return f"{self.invoice_number} - {self.customer.full_name}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored number so a renumbering can be detected on save."""
+        instance = super().from_db(db, field_names, values)
+        instance._stored_invoice_number = instance.__dict__.get('invoice_number')
+        return instance
+
     def save(self, *args, **kwargs):
-        """Generate invoice number if not provided."""
-        if not self.invoice_number:
-            from django.utils import timezone
-            timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
-            self.invoice_number = f"INV-{timestamp}"
+        """Save the invoice and carry a changed number over to its items."""
+        adding = self._state.adding
         super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        invoice_number = self.__dict__.get('invoice_number')
+        renumbered = (
+            not adding
+            and invoice_number is not None
+            and (update_fields is None or 'invoice_number' in update_fields)
+            and invoice_number != getattr(self, '_stored_invoice_number', None)
+        )
+        if renumbered:
+            self.items.exclude(invoice_number=invoice_number).update(invoice_number=invoice_number)
+        self._stored_invoice_number = invoice_number
 
     @property
     def is_overdue(self):
         """Check if invoice is overdue."""
-        from django.utils import timezone
         return self.status not in ['paid', 'cancelled'] and timezone.now().date() > self.due_date
 
     @property
     def remaining_amount(self):
         """Calculate remaining amount to be paid."""
-        total_paid = self.payments.aggregate(
-            total=models.Sum('amount')
-        )['total'] or Decimal('0.00')
+        # Use the amount annotated by InvoiceViewSet when present
+        total_paid = getattr(self, 'paid_amount', None)
+        if total_paid is None:
+            total_paid = self.payments.aggregate(
+                total=models.Sum('amount')
+            )['total'] or Decimal('0.00')
         return self.total_amount - total_paid
 
 
@@ -197,6 +271,7 @@ class InvoiceItem(models.Model):
         related_name='items',
         verbose_name=_('Invoice')
     )
+    invoice_number = models.CharField(_('Invoice number'), max_length=50, editable=False)
     description = models.CharField(_('Description'), max_length=500)
     quantity = models.DecimalField(
         _('Quantity'),
@@ -233,14 +308,31 @@ class InvoiceItem(models.Model):
         ]
 
     def __str__(self):
-        return f"{self.invoice.invoice_number} - {self.description}"
+        return f"{self.invoice_number} - {self.description}"
 
     def save(self, *args, **kwargs):
-        """Calculate line total before saving."""
-        discount_amount = (self.unit_price * self.quantity * self.discount_percentage) / 100
-        self.line_total = (self.unit_price * self.quantity) - discount_amount
+        """Calculate line total and copy the invoice number before saving."""
+        self.line_total = self.calculate_line_total()
+        self.invoice_number = self.invoice.invoice_number
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'invoice' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'invoice_number'}
         super().save(*args, **kwargs)
 
+    def calculate_line_total(self):
+        """Return the line total after discount."""
+        gross = self.unit_price * self.quantity
+        return gross - (gross * self.discount_percentage) / 100
+
+    @classmethod
+    def bulk_create_items(cls, items, batch_size=1000):
+        """Insert many items in batches, filling their derived fields first."""
+        items = list(items)
+        for item in items:
+            item.line_total = item.calculate_line_total()
+            item.invoice_number = item.invoice.invoice_number
+        return cls.objects.bulk_create(items, batch_size=batch_size)
+
 
 class Payment(models.Model):
     """Payment model for tracking payments."""
@@ -262,7 +354,9 @@ class Payment(models.Model):
     ]
     
     # Basic Information
-    payment_number = models.CharField(_('Payment number'), max_length=50, unique=True)
+    payment_number = models.CharField(
+        _('Payment number'), max_length=50, unique=True, default=generate_payment_number
+    )
     invoice = models.ForeignKey(
         Invoice,
         on_delete=models.CASCADE,
@@ -302,25 +396,17 @@ class Payment(models.Model):
     class Meta:
         verbose_name = _('Payment')
         verbose_name_plural = _('Payments')
-        ordering = ['-payment_date']
+        ordering = ['-payment_date', '-created_at']
         indexes = [
             models.Index(fields=['payment_number']),
-            models.Index(fields=['invoice']),
+            models.Index(fields=['invoice', 'status'], name='payment_invoice_status_idx'),
             models.Index(fields=['status']),
-            models.Index(fields=['payment_date']),
+            models.Index(fields=['-payment_date', '-created_at', '-id'], name='payment_date_created_idx'),
         ]
 
     def __str__(self):
         return f"{self.payment_number} - {self.amount}"
 
-    def save(self, *args, **kwargs):
-        """Generate payment number if not provided."""
-        if not self.payment_number:
-            from django.utils import timezone
-            timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
-            self.payment_number = f"PAY-{timestamp}"
-        super().save(*args, **kwargs)
-
 
 class Transaction(models.Model):
     """General transaction model for accounting."""
@@ -331,7 +417,9 @@ class Transaction(models.Model):
     ]
     
     # Basic Information
-    transaction_number = models.CharField(_('Transaction number'), max_length=50, unique=True)
+    transaction_number = models.CharField(
+        _('Transaction number'), max_length=50, unique=True, default=generate_transaction_number
+    )
     description = models.CharField(_('Description'), max_length=500)
     transaction_date = models.DateField(_('Transaction date'))
     amount = models.DecimalField(
@@ -375,21 +463,58 @@ class Transaction(models.Model):
         ordering = ['-transaction_date', '-created_at']
         indexes = [
             models.Index(fields=['transaction_number']),
-            models.Index(fields=['transaction_date']),
+            models.Index(fields=['-transaction_date', '-created_at', '-id'], name='transaction_date_created_idx'),
             models.Index(fields=['debit_account']),
             models.Index(fields=['credit_account']),
         ]
+        constraints = [
+            models.CheckConstraint(
+                check=~models.Q(debit_account=models.F('credit_account')),
+                name='transaction_distinct_accounts',
+                violation_error_message=_('Debit and credit accounts must differ.'),
+            ),
+            models.CheckConstraint(
+                check=models.Q(amount__gt=0),
+                name='transaction_positive_amount',
+                violation_error_message=_('Amount must be greater than zero.'),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.transaction_number} - {self.description}"
 
-    def save(self, *args, **kwargs):
-        """Generate transaction number if not provided."""
-        if not self.transaction_number:
-            from django.utils import timezone
-            timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
-            self.transaction_number = f"TXN-{timestamp}"
-        super().save(*args, **kwargs)
+
+class AccountMonthlyBalance(models.Model):
+    """Debit and credit totals per account and month.
+
+    Backed by the ``finance_account_monthly_balance`` materialized view,
+    which only exists on PostgreSQL and is refreshed by Celery beat.
+    """
+
+    account = models.ForeignKey(
+        Account,
+        on_delete=models.DO_NOTHING,
+        related_name='+',
+        verbose_name=_('Account')
+    )
+    period = models.DateField(_('Period'))
+    debit_total = models.DecimalField(_('Debit total'), max_digits=15, decimal_places=2)
+    credit_total = models.DecimalField(_('Credit total'), max_digits=15, decimal_places=2)
+
+    class Meta:
+        managed = False
+        db_table = 'finance_account_monthly_balance'
+        verbose_name = _('Account Monthly Balance')
+        verbose_name_plural = _('Account Monthly Balances')
+        ordering = ['account', 'period']
+
+    def __str__(self):
+        return f"{self.account_id} - {self.period:%Y-%m}"
+
+    @property
+    def net_change(self):
+        """Debits minus credits for the period."""
+        return self.debit_total - self.credit_total
 
 
 class Expense(models.Model):
@@ -405,7 +530,9 @@ class Expense(models.Model):
     ]
     
     # Basic Information
-    expense_number = models.CharField(_('Expense number'), max_length=50, unique=True)
+    expense_number = models.CharField(
+        _('Expense number'), max_length=50, unique=True, default=generate_expense_number
+    )
     description = models.CharField(_('Description'), max_length=500)
     category = models.CharField(_('Category'), max_length=20, choices=EXPENSE_CATEGORIES)
     amount = models.DecimalField(
@@ -470,15 +597,12 @@ class Expense(models.Model):
             models.Index(fields=['category']),
             models.Index(fields=['expense_date']),
             models.Index(fields=['is_approved']),
+            models.Index(
+                fields=['expense_date'],
+                condition=models.Q(is_approved=False),
+                name='expense_pending_date_idx',
+            ),
         ]
 
     def __str__(self):
         return f"{self.expense_number} - {self.description}"
-
-    def save(self, *args, **kwargs):
-        """Generate expense number if not provided."""
-        if not self.expense_number:
-            from django.utils import timezone
-            timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
-            self.expense_number = f"EXP-{timestamp}"
-        super().save(*args, **kwargs)
\ No newline at end of file
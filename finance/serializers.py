@@ -5,6 +5,9 @@ This module contains serializers for invoice, payment, and financial transaction
 """
 
 from rest_framework import serializers
+
+from core.serializers import ConstraintErrorsMixin
+
 from .models import Account, Invoice, InvoiceItem, Payment, Transaction, Expense
 
 
@@ -51,7 +54,9 @@ class InvoiceSerializer(serializers.ModelSerializer):
     customer_company_name = serializers.CharField(source='customer_company.name', read_only=True)
     created_by_name = serializers.CharField(source='created_by.full_name', read_only=True)
     is_overdue = serializers.ReadOnlyField()
-    remaining_amount = serializers.ReadOnlyField()
+    remaining_amount = serializers.DecimalField(
+        max_digits=12, decimal_places=2, coerce_to_string=False, read_only=True
+    )
     items = InvoiceItemSerializer(many=True, read_only=True)
     
     class Meta:
@@ -87,6 +92,32 @@ class InvoiceSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'invoice_number', 'created_at', 'updated_at']
 
 
+class InvoiceListSerializer(InvoiceSerializer):
+    """Serializer for invoice list rows, without notes, terms and line items."""
+    
+    items = None
+    
+    class Meta(InvoiceSerializer.Meta):
+        fields = [
+            field for field in InvoiceSerializer.Meta.fields
+            if field not in ('notes', 'terms_and_conditions', 'items')
+        ]
+
+
+class InvoiceImportItemSerializer(InvoiceItemSerializer):
+    """Serializer for line items nested in an invoice import."""
+    
+    class Meta(InvoiceItemSerializer.Meta):
+        fields = [field for field in InvoiceItemSerializer.Meta.fields if field != 'invoice']
+        read_only_fields = ['id', 'line_total']
+
+
+class InvoiceImportSerializer(InvoiceSerializer):
+    """Serializer for invoices created through the bulk import endpoint."""
+    
+    items = InvoiceImportItemSerializer(many=True)
+
+
 class PaymentSerializer(serializers.ModelSerializer):
     """Serializer for Payment model."""
     
@@ -116,7 +147,7 @@ class PaymentSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'payment_number', 'created_at', 'updated_at']
 
 
-class TransactionSerializer(serializers.ModelSerializer):
+class TransactionSerializer(ConstraintErrorsMixin, serializers.ModelSerializer):
     """Serializer for Transaction model."""
     
     debit_account_name = serializers.CharField(source='debit_account.name', read_only=True)
@@ -0,0 +1,30 @@
+"""
+Finance signal handlers for the Farjad ERP system.
+
+This module moves invoices to paid once their completed payments cover them.
+"""
+
+from django.db.models import DecimalField, OuterRef, Subquery, Sum
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Invoice, Payment
+
+
+@receiver(post_save, sender=Payment)
+def mark_invoice_paid(sender, instance, **kwargs):
+    """Mark the invoice paid in a single UPDATE when it is fully covered."""
+    if instance.status != 'completed':
+        return
+    completed = (
+        Payment.objects.filter(invoice=OuterRef('pk'), status='completed')
+        .order_by()
+        .values('invoice')
+        .annotate(total=Sum('amount'))
+        .values('total')
+    )
+    Invoice.objects.filter(
+        pk=instance.invoice_id,
+        status__in=['sent', 'overdue'],
+        total_amount__lte=Subquery(completed, output_field=DecimalField(max_digits=12, decimal_places=2)),
+    ).update(status='paid')
@@ -0,0 +1,17 @@
+"""
+Finance background tasks for the Farjad ERP system.
+
+This module contains Celery tasks that keep reporting aggregates up to date.
+"""
+
+from celery import shared_task
+from django.db import connection
+
+
+@shared_task(ignore_result=True)
+def refresh_account_monthly_balances():
+    """Rebuild the per-account monthly totals without blocking readers."""
+    if connection.vendor != 'postgresql':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute('REFRESH MATERIALIZED VIEW CONCURRENTLY finance_account_monthly_balance')
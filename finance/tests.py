@@ -1,3 +1,216 @@
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from core.models import Contact
+from core.pagination import DateCursorPagination
+
+from .models import Account, Invoice, InvoiceItem, Payment, Transaction
+from .serializers import TransactionSerializer
+
+
+class AccountTreeTests(TestCase):
+    """Account subtrees and ancestor chains are read in one query."""
+
+    def setUp(self):
+        self.root = Account.objects.create(name='Assets', code='1000', account_type='asset')
+        self.current = Account.objects.create(name='Current', code='1100', account_type='asset', parent=self.root)
+        self.cash = Account.objects.create(name='Cash', code='1110', account_type='asset', parent=self.current)
+        Account.objects.create(name='Sales', code='4000', account_type='revenue')
+
+    def test_descendants(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(list(self.root.get_descendants()), [self.current, self.cash])
+        self.assertEqual(
+            list(self.root.get_descendants(include_self=True)), [self.root, self.current, self.cash]
+        )
+        self.assertEqual(list(self.cash.get_descendants()), [])
+
+    def test_ancestors(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(list(self.cash.get_ancestors()), [self.root, self.current])
+        self.assertEqual(list(self.root.get_ancestors()), [])
+
+
+class InvoiceNumberTests(TestCase):
+    """Items carry their invoice's number, pushed down only when it changes."""
+
+    def setUp(self):
+        self.customer = Contact.objects.create(
+            first_name='Jane', last_name='Doe', email='jane@example.com', contact_type='customer',
+        )
+        self.invoice = self.create_invoice()
+        self.item = InvoiceItem.objects.create(
+            invoice=self.invoice, description='Labour', quantity=1, unit_price=10,
+        )
+
+    def create_invoice(self):
+        return Invoice.objects.create(
+            customer=self.customer,
+            invoice_date=datetime.date(2026, 1, 1),
+            due_date=datetime.date(2026, 2, 1),
+            subtotal=Decimal('10.00'),
+            tax_amount=Decimal('0.00'),
+            discount_amount=Decimal('0.00'),
+            total_amount=Decimal('10.00'),
+        )
+
+    def test_create_issues_only_the_insert(self):
+        with self.assertNumQueries(1):
+            self.create_invoice()
+
+    def test_unchanged_number_skips_the_items(self):
+        invoice = Invoice.objects.get(pk=self.invoice.pk)
+        invoice.status = 'sent'
+        with self.assertNumQueries(1):
+            invoice.save()
+
+    def test_renumbering_updates_the_items(self):
+        invoice = Invoice.objects.get(pk=self.invoice.pk)
+        invoice.invoice_number = 'INV-RENUMBERED'
+        invoice.save()
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.invoice_number, 'INV-RENUMBERED')
+        self.assertEqual(str(self.item), 'INV-RENUMBERED - Labour')
+
+
+class InvoiceBalanceTests(TestCase):
+    """Balance and overdue state follow the invoice's current rows."""
+
+    def setUp(self):
+        customer = Contact.objects.create(
+            first_name='Jane', last_name='Doe', email='jane@example.com', contact_type='customer',
+        )
+        self.invoice = Invoice.objects.create(
+            customer=customer,
+            invoice_date=datetime.date(2026, 1, 1),
+            due_date=datetime.date(2026, 2, 1),
+            status='sent',
+            subtotal=Decimal('10.00'),
+            tax_amount=Decimal('0.00'),
+            discount_amount=Decimal('0.00'),
+            total_amount=Decimal('10.00'),
+        )
+
+    def test_remaining_amount_sees_new_payments(self):
+        self.assertEqual(self.invoice.remaining_amount, Decimal('10.00'))
+        Payment.objects.create(
+            invoice=self.invoice, amount=Decimal('4.00'), payment_method='cash',
+            payment_date=timezone.now(),
+        )
+        self.invoice.refresh_from_db()
+        self.assertEqual(self.invoice.remaining_amount, Decimal('6.00'))
+
+    def test_is_overdue_follows_status(self):
+        self.assertTrue(self.invoice.is_overdue)
+        self.invoice.status = 'paid'
+        self.assertFalse(self.invoice.is_overdue)
+
+
+class TransactionSerializerConstraintTests(TestCase):
+    """Each transaction check constraint is reported with its own message."""
+
+    def setUp(self):
+        self.cash = Account.objects.create(name='Cash', code='1000', account_type='asset')
+        self.sales = Account.objects.create(name='Sales', code='4000', account_type='revenue')
+
+    def serializer(self, debit, credit):
+        serializer = TransactionSerializer(data={
+            'description': 'Sale',
+            'transaction_date': '2026-01-01',
+            'amount': '10.00',
+            'debit_account': debit.pk,
+            'credit_account': credit.pk,
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        return serializer
+
+    def assert_save_reports(self, serializer, message, **kwargs):
+        with self.assertRaises(ValidationError) as raised:
+            serializer.save(**kwargs)
+        self.assertEqual(raised.exception.detail['non_field_errors'], [message])
+        self.assertFalse(Transaction.objects.exists())
+
+    def test_same_debit_and_credit_account(self):
+        self.assert_save_reports(
+            self.serializer(self.cash, self.cash), 'Debit and credit accounts must differ.'
+        )
+
+    def test_non_positive_amount(self):
+        self.assert_save_reports(
+            self.serializer(self.cash, self.sales), 'Amount must be greater than zero.',
+            amount=Decimal('0.00'),
+        )
+
+    def test_valid_transaction_is_saved(self):
+        transaction = self.serializer(self.cash, self.sales).save()
+        self.assertEqual(transaction.amount, Decimal('10.00'))
+
+
+@mock.patch.object(DateCursorPagination, 'page_size', 4)
+class TransactionCursorPaginationTests(TestCase):
+    """Paging through transactions that share a date and creation time."""
+
+    url = '/api/finance/transactions/'
+
+    def setUp(self):
+        cash = Account.objects.create(name='Cash', code='1000', account_type='asset')
+        sales = Account.objects.create(name='Sales', code='4000', account_type='revenue')
+        for index in range(10):
+            Transaction.objects.create(
+                description=f'Sale {index}',
+                transaction_date=datetime.date(2026, 1, 1 + index % 2),
+                amount=Decimal('10.00') + index % 3,
+                debit_account=cash,
+                credit_account=sales,
+            )
+        Transaction.objects.update(created_at=datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc))
+        user = get_user_model().objects.create_user(
+            username='clerk', email='clerk@example.com', password='secret',
+            first_name='Test', last_name='Clerk',
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+
+    def collect(self, url):
+        ids = []
+        pages = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [row['id'] for row in response.data['results']]
+            pages.append(response.data)
+            url = response.data['next']
+        return ids, pages
+
+    def test_every_row_appears_once_in_order(self):
+        ids, pages = self.collect(self.url)
+        expected = list(
+            Transaction.objects.order_by('-transaction_date', '-created_at', '-id').values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected)
+        self.assertEqual(len(pages), 3)
+
+    def test_every_row_appears_once_with_requested_ordering(self):
+        ids, _ = self.collect(f'{self.url}?ordering=amount')
+        expected = list(Transaction.objects.order_by('amount', 'id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+    def test_previous_link_returns_the_same_page(self):
+        first = self.client.get(self.url).data
+        second = self.client.get(first['next']).data
+        back = self.client.get(second['previous']).data
+        self.assertEqual(
+            [row['id'] for row in back['results']], [row['id'] for row in first['results']]
+        )
+        self.assertIsNone(back['previous'])
 
-# Create your tests here.
+    def test_malformed_cursor_is_not_found(self):
+        response = self.client.get(f'{self.url}?cursor=bogus')
+        self.assertEqual(response.status_code, 404)
@@ -4,16 +4,29 @@ Finance views for the Farjad ERP system.
 This module contains views for invoice, payment, and financial transaction management.
 """
 
-from rest_framework import viewsets
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import DecimalField, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from core.mixins import AuditLogMixin, AutoPrefetchMixin
+from core.pagination import DateCursorPagination
+
+from .filters import AccountFilter, InvoiceFilter, PaymentFilter, TransactionFilter
 from .models import Account, Invoice, InvoiceItem, Payment, Transaction, Expense
 from .serializers import (
     AccountSerializer,
     InvoiceSerializer,
+    InvoiceImportSerializer,
+    InvoiceListSerializer,
     InvoiceItemSerializer,
     PaymentSerializer,
     TransactionSerializer,
@@ -29,14 +42,14 @@ from .serializers import (
     partial_update=extend_schema(summary="Partially update account", description="Partially update a specific account"),
     destroy=extend_schema(summary="Delete account", description="Delete a specific account"),
 )
-class AccountViewSet(viewsets.ModelViewSet):
+class AccountViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing accounts."""
     
     queryset = Account.objects.all()
     serializer_class = AccountSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['account_type', 'is_active']
+    filterset_class = AccountFilter
     search_fields = ['name', 'code', 'description']
     ordering_fields = ['code', 'name', 'created_at']
     ordering = ['code']
@@ -50,17 +63,95 @@ class AccountViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update invoice", description="Partially update a specific invoice"),
     destroy=extend_schema(summary="Delete invoice", description="Delete a specific invoice"),
 )
-class InvoiceViewSet(viewsets.ModelViewSet):
+class InvoiceViewSet(AuditLogMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing invoices."""
     
     queryset = Invoice.objects.all()
     serializer_class = InvoiceSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['status', 'invoice_type', 'customer']
+    filterset_class = InvoiceFilter
     search_fields = ['invoice_number', 'customer__first_name', 'customer__last_name']
     ordering_fields = ['invoice_date', 'due_date', 'total_amount', 'created_at']
-    ordering = ['-invoice_date']
+    ordering = ['-invoice_date', '-created_at']
+    pagination_class = DateCursorPagination
+
+    def get_queryset(self):
+        paid = (
+            Payment.objects.filter(invoice=OuterRef('pk'))
+            .order_by()
+            .values('invoice')
+            .annotate(total=Sum('amount'))
+            .values('total')
+        )
+        # Payments summed in the list query instead of once per invoice
+        queryset = super().get_queryset().annotate(
+            paid_amount=Coalesce(
+                Subquery(paid),
+                Decimal('0.00'),
+                output_field=DecimalField(max_digits=12, decimal_places=2),
+            )
+        )
+        if self.action == 'list':
+            # Leave the text columns and unused related columns behind
+            queryset = queryset.only(
+                'id',
+                'invoice_number',
+                'invoice_type',
+                'status',
+                'customer__full_name',
+                'customer_company__name',
+                'invoice_date',
+                'due_date',
+                'sent_date',
+                'paid_date',
+                'subtotal',
+                'tax_amount',
+                'discount_amount',
+                'total_amount',
+                'tax_rate',
+                'created_at',
+                'updated_at',
+                'created_by__full_name',
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return InvoiceListSerializer
+        return super().get_serializer_class()
+
+    @extend_schema(
+        summary="Bulk import invoices",
+        description="Create many invoices and their line items in one request",
+        request=InvoiceImportSerializer(many=True),
+        responses={201: InvoiceListSerializer(many=True)},
+    )
+    @action(detail=False, methods=['post'], url_path='bulk-import')
+    def bulk_import(self, request):
+        """Create invoices and line items with batched inserts in one transaction."""
+        serializer = InvoiceImportSerializer(
+            data=request.data, many=True, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+
+        invoices, items = [], []
+        for data in serializer.validated_data:
+            item_data = data.pop('items')
+            data.setdefault('created_by', request.user)
+            invoice = Invoice(**data)
+            invoices.append(invoice)
+            items.extend(InvoiceItem(invoice=invoice, **item) for item in item_data)
+
+        with transaction.atomic():
+            Invoice.objects.bulk_create(invoices, batch_size=500)
+            InvoiceItem.bulk_create_items(items)
+
+        for invoice in invoices:
+            # New invoices have no payments yet
+            invoice.paid_amount = Decimal('0.00')
+        response = InvoiceListSerializer(invoices, many=True, context=self.get_serializer_context())
+        return Response(response.data, status=status.HTTP_201_CREATED)
 
 
 @extend_schema_view(
@@ -71,17 +162,18 @@ class InvoiceViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update payment", description="Partially update a specific payment"),
     destroy=extend_schema(summary="Delete payment", description="Delete a specific payment"),
 )
-class PaymentViewSet(viewsets.ModelViewSet):
+class PaymentViewSet(AuditLogMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing payments."""
     
     queryset = Payment.objects.all()
     serializer_class = PaymentSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['status', 'payment_method', 'invoice']
+    filterset_class = PaymentFilter
     search_fields = ['payment_number', 'reference_number', 'notes']
     ordering_fields = ['payment_date', 'amount', 'created_at']
-    ordering = ['-payment_date']
+    ordering = ['-payment_date', '-created_at']
+    pagination_class = DateCursorPagination
 
 
 @extend_schema_view(
@@ -92,14 +184,15 @@ class PaymentViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update transaction", description="Partially update a specific transaction"),
     destroy=extend_schema(summary="Delete transaction", description="Delete a specific transaction"),
 )
-class TransactionViewSet(viewsets.ModelViewSet):
+class TransactionViewSet(AuditLogMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing transactions."""
     
     queryset = Transaction.objects.all()
     serializer_class = TransactionSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['debit_account', 'credit_account']
+    filterset_class = TransactionFilter
     search_fields = ['transaction_number', 'description', 'reference_type']
     ordering_fields = ['transaction_date', 'amount', 'created_at']
-    ordering = ['-transaction_date']
\ No newline at end of file
+    ordering = ['-transaction_date', '-created_at']
+    pagination_class = DateCursorPagination
\ No newline at end of file
@@ -33,6 +33,7 @@ class CategoryAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['name']
+    list_select_related = ['parent']
     
     fieldsets = (
         ('Category Information', {
@@ -169,6 +170,7 @@ class ProductAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['name']
+    list_select_related = ['category', 'brand']
     
     fieldsets = (
         ('Basic Information', {
@@ -226,6 +228,7 @@ class InventoryItemAdmin(admin.ModelAdmin):
         'created_at',
     ]
     ordering = ['-created_at']
+    list_select_related = ['product', 'created_by']
     
     fieldsets = (
         ('Transaction Information', {
@@ -267,6 +270,7 @@ class ProductImageAdmin(admin.ModelAdmin):
         'created_at',
     ]
     ordering = ['product__name', 'sort_order']
+    list_select_related = ['product']
     
     fieldsets = (
         ('Image Information', {
@@ -0,0 +1,49 @@
+"""
+Inventory filters for the Farjad ERP system.
+
+This module contains the FilterSets for products, categories, brands, suppliers and inventory.
+"""
+
+from django_filters.rest_framework import FilterSet
+
+from .models import Brand, Category, InventoryItem, Product, Supplier
+
+
+class ProductFilter(FilterSet):
+    """Filters for the product list."""
+
+    class Meta:
+        model = Product
+        fields = ['category', 'brand', 'status', 'is_taxable']
+
+
+class CategoryFilter(FilterSet):
+    """Filters for the category list."""
+
+    class Meta:
+        model = Category
+        fields = ['parent', 'is_active']
+
+
+class BrandFilter(FilterSet):
+    """Filters for the brand list."""
+
+    class Meta:
+        model = Brand
+        fields = ['is_active']
+
+
+class SupplierFilter(FilterSet):
+    """Filters for the supplier list."""
+
+    class Meta:
+        model = Supplier
+        fields = ['is_active']
+
+
+class InventoryItemFilter(FilterSet):
+    """Filters for the inventory item list."""
+
+    class Meta:
+        model = InventoryItem
+        fields = ['product', 'transaction_type']
@@ -0,0 +1,33 @@
+from django.db import migrations, models
+
+
+def populate_full_path(apps, schema_editor):
+    Category = apps.get_model('inventory', 'Category')
+    categories = {category.pk: category for category in Category.objects.all()}
+
+    def full_path(category):
+        if not category.full_path:
+            parent = categories.get(category.parent_id)
+            category.full_path = f"{full_path(parent)} > {category.name}" if parent else category.name
+        return category.full_path
+
+    for category in categories.values():
+        full_path(category)
+    Category.objects.bulk_update(categories.values(), ['full_path'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='full_path',
+            field=models.TextField(default='', editable=False, verbose_name='Full path'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_full_path, migrations.RunPython.noop),
+    ]
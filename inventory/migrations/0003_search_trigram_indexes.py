@@ -0,0 +1,54 @@
+from django.db import migrations
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_filter_listing_indexes'),
+        ('inventory', '0002_category_full_path'),
+    ]
+
+    operations = [
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_product_name_trgm_idx ON inventory_product USING gin (UPPER(name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_product_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_product_sku_trgm_idx ON inventory_product USING gin (UPPER(sku::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_product_sku_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_product_barcode_trgm_idx ON inventory_product USING gin (UPPER(barcode::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_product_barcode_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_product_description_trgm_idx ON inventory_product USING gin (UPPER(description::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_product_description_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_category_name_trgm_idx ON inventory_category USING gin (UPPER(name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_category_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_category_description_trgm_idx ON inventory_category USING gin (UPPER(description::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_category_description_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_supplier_name_trgm_idx ON inventory_supplier USING gin (UPPER(name::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_supplier_name_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_supplier_contact_person_trgm_idx ON inventory_supplier USING gin (UPPER(contact_person::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_supplier_contact_person_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_supplier_email_trgm_idx ON inventory_supplier USING gin (UPPER(email::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_supplier_email_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX inventory_supplier_city_trgm_idx ON inventory_supplier USING gin (UPPER(city::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX inventory_supplier_city_trgm_idx;',
+        ),
+    ]
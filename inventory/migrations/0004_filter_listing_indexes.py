@@ -0,0 +1,61 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0003_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='brand',
+            name='inventory_b_is_acti_148977_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='category',
+            name='inventory_c_parent__a38b2c_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='category',
+            name='inventory_c_is_acti_63d81f_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='inventory_p_categor_607069_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='inventory_p_brand_i_305378_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='product',
+            name='inventory_p_status_2ba142_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='supplier',
+            name='inventory_s_is_acti_3743da_idx',
+        ),
+        migrations.AddIndex(
+            model_name='brand',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['name'], name='brand_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='category',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['name'], name='category_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['name'], name='product_active_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['status', 'category', 'brand'], name='product_status_cat_brand_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['name'], name='supplier_active_name_idx'),
+        ),
+    ]
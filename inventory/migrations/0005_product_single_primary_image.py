@@ -0,0 +1,30 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:26
+
+from django.db import migrations, models
+
+
+def demote_extra_primary_images(apps, schema_editor):
+    ProductImage = apps.get_model('inventory', 'ProductImage')
+    seen = set()
+    extra = []
+    primaries = ProductImage.objects.filter(is_primary=True).order_by('product_id', 'sort_order', 'created_at', 'pk')
+    for image_id, product_id in primaries.values_list('pk', 'product_id'):
+        if product_id in seen:
+            extra.append(image_id)
+        seen.add(product_id)
+    ProductImage.objects.filter(pk__in=extra).update(is_primary=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0004_filter_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(demote_extra_primary_images, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='productimage',
+            constraint=models.UniqueConstraint(condition=models.Q(('is_primary', True)), fields=('product',), name='product_single_primary_image', violation_error_message='Only one primary image is allowed per product.'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+
+
+def populate_current_stock(apps, schema_editor):
+    Product = apps.get_model('inventory', 'Product')
+    InventoryItem = apps.get_model('inventory', 'InventoryItem')
+    stock = (
+        InventoryItem.objects.filter(product=OuterRef('pk'))
+        .order_by()
+        .values('product')
+        .annotate(total=Sum('quantity'))
+        .values('total')
+    )
+    Product.objects.update(current_stock=Coalesce(Subquery(stock), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('inventory', '0005_product_single_primary_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='product',
+            name='current_stock',
+            field=models.IntegerField(db_index=True, default=0, editable=False, verbose_name='Current stock'),
+        ),
+        migrations.RunPython(populate_current_stock, migrations.RunPython.noop),
+    ]
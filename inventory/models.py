@@ -5,6 +5,8 @@ This module contains product, category, brand, and inventory management models.
 """
 
 from django.db import models
+from django.db.models import OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
 from django.contrib.auth import get_user_model
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
@@ -26,6 +28,7 @@ class Category(models.Model):
         related_name='children',
         verbose_name=_('Parent category')
     )
+    full_path = models.TextField(_('Full path'), editable=False)
     is_active = models.BooleanField(_('Is active'), default=True)
     created_at = models.DateTimeField(_('Created at'), auto_now_add=True)
     updated_at = models.DateTimeField(_('Updated at'), auto_now=True)
@@ -36,19 +39,24 @@ class Category(models.Model):
         ordering = ['name']
         indexes = [
             models.Index(fields=['name']),
-            models.Index(fields=['parent']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['name'], condition=models.Q(is_active=True), name='category_active_name_idx'),
         ]
 
     def __str__(self):
         return self.name
 
-    @property
-    def full_path(self):
-        """Return the full category path."""
-        if self.parent:
-            return f"{self.parent.full_path} > {self.name}"
-        return self.name
+    def save(self, *args, **kwargs):
+        """Keep the stored path in sync here and in every subcategory."""
+        previous_path = self.full_path
+        self.full_path = f"{self.parent.full_path} > {self.name}" if self.parent else self.name
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'name', 'parent'} & set(update_fields):
+            kwargs['update_fields'] = {*update_fields, 'full_path'}
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        if not adding and self.full_path != previous_path:
+            for child in self.children.all():
+                child.save(update_fields=['full_path'])
 
 
 class Brand(models.Model):
@@ -68,7 +76,7 @@ class Brand(models.Model):
         ordering = ['name']
         indexes = [
             models.Index(fields=['name']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['name'], condition=models.Q(is_active=True), name='brand_active_name_idx'),
         ]
 
     def __str__(self):
@@ -97,13 +105,28 @@ class Supplier(models.Model):
         ordering = ['name']
         indexes = [
             models.Index(fields=['name']),
-            models.Index(fields=['is_active']),
+            models.Index(fields=['name'], condition=models.Q(is_active=True), name='supplier_active_name_idx'),
         ]
 
     def __str__(self):
         return self.name
 
 
+class ProductQuerySet(models.QuerySet):
+    """Query helpers for products."""
+
+    def refresh_current_stock(self):
+        """Recompute the stored stock of these products in one UPDATE."""
+        stock = (
+            InventoryItem.objects.filter(product=OuterRef('pk'))
+            .order_by()
+            .values('product')
+            .annotate(total=Sum('quantity'))
+            .values('total')
+        )
+        return self.update(current_stock=Coalesce(Subquery(stock), 0))
+
+
 class Product(models.Model):
     """Product model for inventory management."""
     
@@ -162,6 +185,7 @@ class Product(models.Model):
     unit_type = models.CharField(_('Unit type'), max_length=20, choices=UNIT_TYPES, default='piece')
     min_stock_level = models.PositiveIntegerField(_('Minimum stock level'), default=0)
     max_stock_level = models.PositiveIntegerField(_('Maximum stock level'), default=1000)
+    current_stock = models.IntegerField(_('Current stock'), default=0, editable=False, db_index=True)
     
     # Physical Properties
     weight = models.DecimalField(
@@ -200,6 +224,8 @@ class Product(models.Model):
         verbose_name=_('Created by')
     )
 
+    objects = ProductQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('Product')
         verbose_name_plural = _('Products')
@@ -208,9 +234,8 @@ class Product(models.Model):
             models.Index(fields=['sku']),
             models.Index(fields=['barcode']),
             models.Index(fields=['name']),
-            models.Index(fields=['category']),
-            models.Index(fields=['brand']),
-            models.Index(fields=['status']),
+            models.Index(fields=['name'], condition=models.Q(status='active'), name='product_active_name_idx'),
+            models.Index(fields=['status', 'category', 'brand'], name='product_status_cat_brand_idx'),
         ]
 
     def __str__(self):
@@ -223,13 +248,6 @@ class Product(models.Model):
             return ((self.selling_price - self.cost_price) / self.cost_price) * 100
         return 0
 
-    @property
-    def current_stock(self):
-        """Get current stock level."""
-        return self.inventory_items.aggregate(
-            total=models.Sum('quantity')
-        )['total'] or 0
-
     @property
     def is_low_stock(self):
         """Check if product is low on stock."""
@@ -291,6 +309,17 @@ class InventoryItem(models.Model):
     def __str__(self):
         return f"{self.product.name} - {self.quantity} ({self.transaction_type})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the stored product and quantity so stock can be moved on save."""
+        instance = super().from_db(db, field_names, values)
+        instance.remember_stored_stock()
+        return instance
+
+    def remember_stored_stock(self):
+        """Record the product and quantity this movement currently counts towards."""
+        self._stored_stock = (self.__dict__.get('product_id'), self.__dict__.get('quantity'))
+
 
 class ProductImage(models.Model):
     """Product image model for multiple product images."""
@@ -316,19 +345,14 @@ class ProductImage(models.Model):
             models.Index(fields=['is_primary']),
             models.Index(fields=['sort_order']),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['product'],
+                condition=models.Q(is_primary=True),
+                name='product_single_primary_image',
+                violation_error_message=_('Only one primary image is allowed per product.'),
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.product.name} - Image {self.id}"
-
-    def clean(self):
-        """Ensure only one primary image per product."""
-        from django.core.exceptions import ValidationError
-        
-        if self.is_primary:
-            existing_primary = ProductImage.objects.filter(
-                product=self.product,
-                is_primary=True
-            ).exclude(pk=self.pk)
-            
-            if existing_primary.exists():
-                raise ValidationError(_('Only one primary image is allowed per product.'))
\ No newline at end of file
+        return f"{self.product.name} - Image {self.id}"
\ No newline at end of file
@@ -114,6 +114,13 @@ class ProductSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+class ProductListSerializer(ProductSerializer):
+    """Serializer for product list rows, without the long description."""
+    
+    class Meta(ProductSerializer.Meta):
+        fields = [field for field in ProductSerializer.Meta.fields if field != 'description']
+
+
 class ProductImageSerializer(serializers.ModelSerializer):
     """Serializer for ProductImage model."""
     
@@ -0,0 +1,59 @@
+"""
+Inventory signal handlers for the Farjad ERP system.
+
+This module retires cached category, brand and supplier lists when their rows
+change and keeps the stored product stock in sync with inventory movements.
+"""
+
+from collections import Counter
+
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.mixins import invalidate_list_cache
+
+from .models import Brand, Category, InventoryItem, Product, Supplier
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Brand)
+@receiver(post_delete, sender=Brand)
+@receiver(post_save, sender=Supplier)
+@receiver(post_delete, sender=Supplier)
+def invalidate_cached_lists(sender, **kwargs):
+    """Drop cached list responses for the changed model."""
+    invalidate_list_cache(sender)
+
+
+def apply_stock_changes(changes):
+    """Add each quantity to its product's stored stock in one atomic UPDATE."""
+    for product_id, quantity in changes.items():
+        if product_id is not None and quantity:
+            Product.objects.filter(pk=product_id).update(current_stock=F('current_stock') + quantity)
+
+
+@receiver(post_save, sender=InventoryItem)
+def move_product_stock(sender, instance, created, **kwargs):
+    """Move the movement's quantity from its stored product to its current one."""
+    stored_product_id, stored_quantity = getattr(instance, '_stored_stock', (None, None))
+    if not created and (stored_product_id is None or stored_quantity is None):
+        # Saved without a loaded copy; recount the product from its movements
+        Product.objects.filter(pk=instance.product_id).refresh_current_stock()
+    else:
+        changes = Counter({instance.product_id: instance.quantity})
+        if not created:
+            changes[stored_product_id] -= stored_quantity
+        apply_stock_changes(changes)
+    instance.remember_stored_stock()
+
+
+@receiver(post_delete, sender=InventoryItem)
+def remove_product_stock(sender, instance, **kwargs):
+    """Take a deleted movement's stored quantity off its product."""
+    product_id, quantity = getattr(instance, '_stored_stock', (None, None))
+    if product_id is None or quantity is None:
+        Product.objects.filter(pk=instance.product_id).refresh_current_stock()
+    else:
+        apply_stock_changes({product_id: -quantity})
@@ -1,3 +1,114 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from core.mixins import invalidate_list_cache
+
+from .models import Brand, Category, InventoryItem, Product
+
+User = get_user_model()
+
+LOCMEM_CACHES = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+
+
+class ProductStockTests(TestCase):
+    """Stored product stock follows its inventory movements."""
+
+    def setUp(self):
+        category = Category.objects.create(name='Tools')
+        brand = Brand.objects.create(name='Acme')
+        self.first, self.second = [
+            Product.objects.create(
+                name=f'Product {index}', sku=f'SKU-{index}', category=category, brand=brand,
+                cost_price=1, selling_price=2,
+            )
+            for index in range(2)
+        ]
+
+    def stock(self, product):
+        product.refresh_from_db(fields=['current_stock'])
+        return product.current_stock
+
+    def test_create_update_and_delete_adjust_stock(self):
+        item = InventoryItem.objects.create(product=self.first, quantity=5, transaction_type='in')
+        InventoryItem.objects.create(product=self.first, quantity=-2, transaction_type='out')
+        self.assertEqual(self.stock(self.first), 3)
+        item.quantity = 7
+        item.save()
+        self.assertEqual(self.stock(self.first), 5)
+        item.delete()
+        self.assertEqual(self.stock(self.first), -2)
+
+    def test_moving_a_movement_updates_both_products(self):
+        item = InventoryItem.objects.create(product=self.first, quantity=5, transaction_type='in')
+        item = InventoryItem.objects.get(pk=item.pk)
+        item.product = self.second
+        item.save()
+        self.assertEqual(self.stock(self.first), 0)
+        self.assertEqual(self.stock(self.second), 5)
+
+    def test_moving_through_the_api_updates_both_products(self):
+        client = APIClient()
+        client.force_authenticate(
+            User.objects.create_user(
+                username='clerk', email='clerk@example.com', password='pw',
+                first_name='Stock', last_name='Clerk',
+            )
+        )
+        item = InventoryItem.objects.create(product=self.first, quantity=5, transaction_type='in')
+        response = client.patch(
+            f'/api/inventory/inventory/{item.pk}/', {'product': self.second.pk, 'quantity': 4}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.stock(self.first), 0)
+        self.assertEqual(self.stock(self.second), 4)
+
+    def test_deleting_the_product_queryset_keeps_other_stock(self):
+        InventoryItem.objects.create(product=self.first, quantity=5, transaction_type='in')
+        InventoryItem.objects.create(product=self.second, quantity=3, transaction_type='in')
+        InventoryItem.objects.filter(product=self.first).delete()
+        self.assertEqual(self.stock(self.first), 0)
+        self.assertEqual(self.stock(self.second), 3)
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CategoryListCacheTests(TestCase):
+    """Cached category lists are retired when categories change."""
+
+    url = '/api/inventory/categories/'
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user(
+                username='clerk', email='clerk@example.com', password='pw',
+                first_name='Stock', last_name='Clerk',
+            )
+        )
+
+    def names(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        return [row['name'] for row in response.data['results']]
+
+    def test_created_category_is_listed(self):
+        Category.objects.create(name='Tools')
+        self.assertEqual(self.names(), ['Tools'])
+        Category.objects.create(name='Paint')
+        self.assertEqual(self.names(), ['Paint', 'Tools'])
+
+    def test_deleted_category_is_dropped(self):
+        category = Category.objects.create(name='Tools')
+        self.assertEqual(self.names(), ['Tools'])
+        category.delete()
+        self.assertEqual(self.names(), [])
+
+    def test_queryset_update_needs_explicit_invalidation(self):
+        Category.objects.create(name='Tools')
+        self.assertEqual(self.names(), ['Tools'])
+        Category.objects.update(name='Hardware')
+        self.assertEqual(self.names(), ['Tools'])
+        invalidate_list_cache(Category)
+        self.assertEqual(self.names(), ['Hardware'])
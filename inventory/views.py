@@ -4,15 +4,23 @@ Inventory views for the Farjad ERP system.
 This module contains views for product, category, brand, and inventory management.
 """
 
-from rest_framework import viewsets
+from django.db import transaction
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from core.mixins import AutoPrefetchMixin, CachedListMixin
+from core.pagination import CreatedAtCursorPagination
+
+from .filters import ProductFilter, CategoryFilter, BrandFilter, SupplierFilter, InventoryItemFilter
 from .models import Product, Category, Brand, Supplier, InventoryItem, ProductImage
 from .serializers import (
     ProductSerializer,
+    ProductListSerializer,
     CategorySerializer,
     BrandSerializer,
     SupplierSerializer,
@@ -29,18 +37,53 @@ from .serializers import (
     partial_update=extend_schema(summary="Partially update product", description="Partially update a specific product"),
     destroy=extend_schema(summary="Delete product", description="Delete a specific product"),
 )
-class ProductViewSet(viewsets.ModelViewSet):
+class ProductViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing products."""
     
     queryset = Product.objects.all()
     serializer_class = ProductSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['category', 'brand', 'status', 'is_taxable']
+    filterset_class = ProductFilter
     search_fields = ['name', 'sku', 'barcode', 'description']
     ordering_fields = ['name', 'sku', 'created_at', 'selling_price']
     ordering = ['name']
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Leave the description and unused related columns behind
+            queryset = queryset.only(
+                'id',
+                'name',
+                'sku',
+                'barcode',
+                'short_description',
+                'category__name',
+                'brand__name',
+                'cost_price',
+                'selling_price',
+                'unit_type',
+                'min_stock_level',
+                'max_stock_level',
+                'current_stock',
+                'weight',
+                'dimensions',
+                'status',
+                'is_taxable',
+                'tax_rate',
+                'image',
+                'created_at',
+                'updated_at',
+                'created_by',
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ProductListSerializer
+        return super().get_serializer_class()
+
 
 @extend_schema_view(
     list=extend_schema(summary="List categories", description="Retrieve a list of all categories"),
@@ -50,14 +93,14 @@ class ProductViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update category", description="Partially update a specific category"),
     destroy=extend_schema(summary="Delete category", description="Delete a specific category"),
 )
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(CachedListMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing categories."""
     
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['parent', 'is_active']
+    filterset_class = CategoryFilter
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
@@ -71,14 +114,14 @@ class CategoryViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update brand", description="Partially update a specific brand"),
     destroy=extend_schema(summary="Delete brand", description="Delete a specific brand"),
 )
-class BrandViewSet(viewsets.ModelViewSet):
+class BrandViewSet(CachedListMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing brands."""
     
     queryset = Brand.objects.all()
     serializer_class = BrandSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['is_active']
+    filterset_class = BrandFilter
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
@@ -92,14 +135,14 @@ class BrandViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update supplier", description="Partially update a specific supplier"),
     destroy=extend_schema(summary="Delete supplier", description="Delete a specific supplier"),
 )
-class SupplierViewSet(viewsets.ModelViewSet):
+class SupplierViewSet(CachedListMixin, AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing suppliers."""
     
     queryset = Supplier.objects.all()
     serializer_class = SupplierSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['is_active']
+    filterset_class = SupplierFilter
     search_fields = ['name', 'contact_person', 'email', 'city']
     ordering_fields = ['name', 'created_at']
     ordering = ['name']
@@ -113,14 +156,60 @@ class SupplierViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update inventory item", description="Partially update a specific inventory item"),
     destroy=extend_schema(summary="Delete inventory item", description="Delete a specific inventory item"),
 )
-class InventoryViewSet(viewsets.ModelViewSet):
+class InventoryViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing inventory items."""
     
     queryset = InventoryItem.objects.all()
     serializer_class = InventoryItemSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['product', 'transaction_type']
+    filterset_class = InventoryItemFilter
     search_fields = ['product__name', 'reference_number', 'notes']
     ordering_fields = ['created_at', 'quantity']
-    ordering = ['-created_at']
\ No newline at end of file
+    ordering = ['-created_at']
+    pagination_class = CreatedAtCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Load only the product and user columns the rows display
+            queryset = queryset.only(
+                'id',
+                'product__name',
+                'product__sku',
+                'quantity',
+                'transaction_type',
+                'reference_number',
+                'notes',
+                'unit_cost',
+                'created_at',
+                'created_by__full_name',
+            )
+        return queryset
+
+    @extend_schema(
+        summary="Bulk import inventory items",
+        description="Record many inventory movements in one request",
+        request=InventoryItemSerializer(many=True),
+        responses={201: InventoryItemSerializer(many=True)},
+    )
+    @action(detail=False, methods=['post'], url_path='bulk-import')
+    def bulk_import(self, request):
+        """Create inventory items with batched inserts and refresh stock once per product."""
+        serializer = InventoryItemSerializer(
+            data=request.data, many=True, context=self.get_serializer_context()
+        )
+        serializer.is_valid(raise_exception=True)
+
+        items = []
+        for data in serializer.validated_data:
+            data.setdefault('created_by', request.user)
+            items.append(InventoryItem(**data))
+
+        with transaction.atomic():
+            InventoryItem.objects.bulk_create(items, batch_size=1000)
+            # bulk_create skips the post_save receiver that keeps stock in sync
+            Product.objects.filter(pk__in={item.product_id for item in items}).refresh_current_stock()
+
+        response = InventoryItemSerializer(items, many=True, context=self.get_serializer_context())
+        return Response(response.data, status=status.HTTP_201_CREATED)
\ No newline at end of file
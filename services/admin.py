@@ -5,7 +5,11 @@ This module contains admin configurations for service requests, technicians, and
 """
 
 from django.contrib import admin
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db.models.functions import Substr
 from django.utils.html import format_html
+from core.paginators import FasterAdminPaginator
 from .models import ServiceRequest, ServiceType, Technician, ServiceNote, Schedule, ServiceRating
 
 
@@ -73,6 +77,8 @@ class TechnicianAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['user__last_name', 'user__first_name']
+    list_select_related = ['user']
+    raw_id_fields = ['user']
     
     fieldsets = (
         ('Basic Information', {
@@ -128,6 +134,26 @@ class ServiceRequestAdmin(admin.ModelAdmin):
         'updated_at',
     ]
     ordering = ['-created_at']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    list_select_related = ['customer', 'service_type', 'assigned_technician']
+    autocomplete_fields = ['customer', 'customer_company', 'service_type', 'assigned_technician']
+    raw_id_fields = ['assigned_by', 'created_by']
+    
+    def get_search_results(self, request, queryset, search_term):
+        """Match a full email address against the customer email only."""
+        term = search_term.strip()
+        try:
+            validate_email(term)
+        except ValidationError:
+            return super().get_search_results(request, queryset, search_term)
+        return queryset.filter(customer__email__iexact=term), False
+    
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        """Load service types by name only."""
+        if db_field.name == 'service_type':
+            kwargs['queryset'] = ServiceType.objects.only('id', 'name')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
     
     fieldsets = (
         ('Basic Information', {
@@ -182,12 +208,23 @@ class ServiceNoteAdmin(admin.ModelAdmin):
         'created_at',
     ]
     ordering = ['-created_at']
+    list_select_related = ['service_request', 'created_by']
+    autocomplete_fields = ['service_request']
+    raw_id_fields = ['created_by']
+    
+    def get_queryset(self, request):
+        """Compute the changelist note preview in the database instead of loading notes."""
+        queryset = super().get_queryset(request)
+        match = request.resolver_match
+        if match and match.url_name.endswith('_changelist'):
+            queryset = queryset.defer('note').annotate(note_start=Substr('note', 1, 51))
+        return queryset
     
     def note_preview(self, obj):
         """Show a preview of the note."""
-        if len(obj.note) > 50:
-            return f"{obj.note[:50]}..."
-        return obj.note
+        if len(obj.note_start) > 50:
+            return f"{obj.note_start[:50]}..."
+        return obj.note_start
     note_preview.short_description = 'Note Preview'
     
     fieldsets = (
@@ -228,6 +265,11 @@ class ScheduleAdmin(admin.ModelAdmin):
         'created_at',
     ]
     ordering = ['start_time']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+    list_select_related = ['technician', 'service_request']
+    autocomplete_fields = ['technician', 'service_request']
+    raw_id_fields = ['created_by']
     
     fieldsets = (
         ('Schedule Information', {
@@ -266,6 +308,9 @@ class ServiceRatingAdmin(admin.ModelAdmin):
         'created_at',
     ]
     ordering = ['-created_at']
+    list_select_related = ['service_request', 'created_by']
+    autocomplete_fields = ['service_request']
+    raw_id_fields = ['created_by']
     
     fieldsets = (
         ('Rating Information', {
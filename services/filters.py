@@ -0,0 +1,43 @@
+"""
+Services filters for the Farjad ERP system.
+
+This module contains the FilterSets for service requests, service types, technicians and schedules.
+"""
+
+from django_filters.rest_framework import CharFilter, FilterSet
+
+from .models import Schedule, ServiceRequest, ServiceType, Technician
+
+
+class ServiceRequestFilter(FilterSet):
+    """Filters for the service request list."""
+
+    request_number = CharFilter(lookup_expr='istartswith')
+
+    class Meta:
+        model = ServiceRequest
+        fields = ['status', 'priority', 'service_type', 'assigned_technician']
+
+
+class ServiceTypeFilter(FilterSet):
+    """Filters for the service type list."""
+
+    class Meta:
+        model = ServiceType
+        fields = ['is_active']
+
+
+class TechnicianFilter(FilterSet):
+    """Filters for the technician list."""
+
+    class Meta:
+        model = Technician
+        fields = ['skill_level', 'is_available']
+
+
+class ScheduleFilter(FilterSet):
+    """Filters for the schedule list."""
+
+    class Meta:
+        model = Schedule
+        fields = ['technician', 'is_confirmed']
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(fields=['created_at'], name='services_se_created_fe46d7_idx'),
+        ),
+    ]
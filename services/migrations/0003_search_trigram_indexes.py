@@ -0,0 +1,26 @@
+from django.db import migrations
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_filter_listing_indexes'),
+        ('services', '0002_service_request_created_index'),
+    ]
+
+    operations = [
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX services_servicerequest_request_number_trgm_idx ON services_servicerequest USING gin (UPPER(request_number::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX services_servicerequest_request_number_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX services_servicerequest_title_trgm_idx ON services_servicerequest USING gin (UPPER(title::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX services_servicerequest_title_trgm_idx;',
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX services_servicerequest_description_trgm_idx ON services_servicerequest USING gin (UPPER(description::text) gin_trgm_ops);',
+            reverse_sql='DROP INDEX services_servicerequest_description_trgm_idx;',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0003_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='servicerequest',
+            name='services_se_status_9254ae_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='servicerequest',
+            name='services_se_priorit_f2090e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='servicerequest',
+            name='services_se_assigne_a96beb_idx',
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(fields=['status', 'priority', '-created_at'], name='sr_status_priority_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='servicerequest',
+            index=models.Index(fields=['assigned_technician', 'status', 'scheduled_date'], name='sr_technician_schedule_idx'),
+        ),
+    ]
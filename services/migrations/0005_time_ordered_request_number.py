@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:32
+
+from django.db import migrations, models
+import services.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0004_request_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='servicerequest',
+            name='request_number',
+            field=models.CharField(default=services.models.generate_request_number, max_length=50, unique=True, verbose_name='Request number'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:36
+
+from django.db import migrations, models
+
+from core.operations import PostgreSQLRunSQL
+
+
+def check_schedule_times(apps, schema_editor):
+    """Stop with the offending ids when existing rows would break the new constraints."""
+    Schedule = apps.get_model('services', 'Schedule')
+    problems = []
+    invalid = list(Schedule.objects.filter(end_time__lte=models.F('start_time')).values_list('pk', flat=True))
+    if invalid:
+        problems.append(f'end_time not after start_time: {invalid}')
+    # Only PostgreSQL gets the overlap exclusion constraint
+    if schema_editor.connection.vendor == 'postgresql':
+        valid = Schedule.objects.filter(end_time__gt=models.F('start_time'))
+        clashing = valid.filter(
+            models.Exists(
+                valid.filter(
+                    technician=models.OuterRef('technician'),
+                    start_time__lt=models.OuterRef('end_time'),
+                    end_time__gt=models.OuterRef('start_time'),
+                ).exclude(pk=models.OuterRef('pk'))
+            )
+        )
+        overlapping = list(clashing.order_by('technician_id', 'start_time').values_list('pk', flat=True))
+        if overlapping:
+            problems.append(f'overlapping schedules of one technician: {overlapping}')
+    if problems:
+        raise RuntimeError(
+            'Fix or delete these schedules before migrating: ' + '; '.join(problems)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0005_time_ordered_request_number'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_schedule_times, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='schedule',
+            constraint=models.CheckConstraint(check=models.Q(('end_time__gt', models.F('start_time'))), name='schedule_valid_time_range', violation_error_message='End time must be after start time.'),
+        ),
+        PostgreSQLRunSQL(
+            sql='CREATE EXTENSION IF NOT EXISTS btree_gist;',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        PostgreSQLRunSQL(
+            sql=(
+                'ALTER TABLE services_schedule ADD CONSTRAINT schedule_no_technician_overlap '
+                "EXCLUDE USING gist (technician_id WITH =, tstzrange(start_time, end_time, '[)') WITH &&);"
+            ),
+            reverse_sql='ALTER TABLE services_schedule DROP CONSTRAINT schedule_no_technician_overlap;',
+        ),
+    ]
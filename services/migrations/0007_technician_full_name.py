@@ -0,0 +1,28 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def populate_full_name(apps, schema_editor):
+    Technician = apps.get_model('services', 'Technician')
+    User = apps.get_model('accounts', 'User')
+    Technician.objects.update(
+        full_name=Subquery(User.objects.filter(pk=OuterRef('user_id')).values('full_name')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_full_name'),
+        ('services', '0006_schedule_time_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='technician',
+            name='full_name',
+            field=models.CharField(default='', editable=False, max_length=301, verbose_name='Full name'),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_full_name, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+from django.db import migrations
+
+from core.operations import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0007_technician_full_name'),
+    ]
+
+    operations = [
+        PostgreSQLRunSQL(
+            sql='CREATE INDEX services_servicerequest_request_number_prefix_idx ON services_servicerequest (UPPER(request_number::text) text_pattern_ops);',
+            reverse_sql='DROP INDEX services_servicerequest_request_number_prefix_idx;',
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0008_request_number_prefix_index'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='schedule',
+            options={'ordering': ['start_time', 'created_at'], 'verbose_name': 'Schedule', 'verbose_name_plural': 'Schedules'},
+        ),
+        migrations.RemoveIndex(
+            model_name='schedule',
+            name='services_sc_start_t_babafe_idx',
+        ),
+        migrations.AddIndex(
+            model_name='schedule',
+            index=models.Index(fields=['start_time', 'created_at', 'id'], name='schedule_start_created_idx'),
+        ),
+    ]
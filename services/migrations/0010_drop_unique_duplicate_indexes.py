@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-15 02:41
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0009_schedule_start_cursor_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='servicerating',
+            name='services_se_service_305afb_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='servicerequest',
+            name='services_se_request_6a378a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='servicetype',
+            name='services_se_name_0209bb_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='technician',
+            name='services_te_employe_2ed5a7_idx',
+        ),
+    ]
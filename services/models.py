@@ -4,15 +4,23 @@ Services models for the Farjad ERP system.
 This module contains service request, technician, and scheduling models.
 """
 
-from django.db import models
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MinValueValidator, MaxValueValidator
 from decimal import Decimal
 
+from core.utils import time_ordered_id
+
 User = get_user_model()
 
 
+def generate_request_number():
+    """Return a new unique service request number."""
+    return f'SR-{time_ordered_id()}'
+
+
 class ServiceType(models.Model):
     """Service type model for categorizing services."""
     
@@ -34,7 +42,6 @@ class ServiceType(models.Model):
         verbose_name_plural = _('Service Types')
         ordering = ['name']
         indexes = [
-            models.Index(fields=['name']),
             models.Index(fields=['is_active']),
         ]
 
@@ -42,6 +49,33 @@ class ServiceType(models.Model):
         return self.name
 
 
+class TechnicianQuerySet(models.QuerySet):
+    """Query helpers for technicians."""
+
+    def claim_available(self, service_type):
+        """
+        Mark one available technician specialized in ``service_type`` as busy.
+
+        Rows locked by a concurrent claim are skipped instead of waited on, so
+        parallel dispatchers each get a different technician. Returns the
+        claimed technician, or ``None`` when nobody is free.
+        """
+        with transaction.atomic():
+            technician = (
+                self.select_for_update(skip_locked=True, of=('self',))
+                .filter(is_available=True, specializations=service_type)
+                .order_by()
+                .first()
+            )
+            if technician is not None:
+                technician.is_available = False
+                technician.updated_at = timezone.now()
+                self.model.objects.filter(pk=technician.pk).update(
+                    is_available=False, updated_at=technician.updated_at
+                )
+        return technician
+
+
 class Technician(models.Model):
     """Technician model for service technicians."""
     
@@ -73,26 +107,31 @@ class Technician(models.Model):
     )
     is_available = models.BooleanField(_('Is available'), default=True)
     max_daily_hours = models.PositiveIntegerField(_('Max daily hours'), default=8)
+    full_name = models.CharField(_('Full name'), max_length=301, editable=False)
     created_at = models.DateTimeField(_('Created at'), auto_now_add=True)
     updated_at = models.DateTimeField(_('Updated at'), auto_now=True)
 
+    objects = TechnicianQuerySet.as_manager()
+
     class Meta:
         verbose_name = _('Technician')
         verbose_name_plural = _('Technicians')
         ordering = ['user__last_name', 'user__first_name']
         indexes = [
-            models.Index(fields=['employee_id']),
             models.Index(fields=['skill_level']),
             models.Index(fields=['is_available']),
         ]
 
     def __str__(self):
-        return f"{self.user.full_name} ({self.employee_id})"
+        return f"{self.full_name} ({self.employee_id})"
 
-    @property
-    def full_name(self):
-        """Return the full name of the technician."""
-        return self.user.full_name
+    def save(self, *args, **kwargs):
+        """Copy the stored full name of the user onto the technician."""
+        self.full_name = self.user.full_name
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'user' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'full_name'}
+        super().save(*args, **kwargs)
 
 
 class ServiceRequest(models.Model):
@@ -115,7 +154,9 @@ class ServiceRequest(models.Model):
     ]
     
     # Basic Information
-    request_number = models.CharField(_('Request number'), max_length=50, unique=True)
+    request_number = models.CharField(
+        _('Request number'), max_length=50, unique=True, default=generate_request_number
+    )
     title = models.CharField(_('Title'), max_length=200)
     description = models.TextField(_('Description'))
     
@@ -209,25 +250,18 @@ class ServiceRequest(models.Model):
         verbose_name_plural = _('Service Requests')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['request_number']),
             models.Index(fields=['customer']),
-            models.Index(fields=['status']),
-            models.Index(fields=['priority']),
-            models.Index(fields=['assigned_technician']),
+            models.Index(fields=['status', 'priority', '-created_at'], name='sr_status_priority_created_idx'),
+            models.Index(
+                fields=['assigned_technician', 'status', 'scheduled_date'], name='sr_technician_schedule_idx'
+            ),
             models.Index(fields=['scheduled_date']),
+            models.Index(fields=['created_at']),
         ]
 
     def __str__(self):
         return f"{self.request_number} - {self.title}"
 
-    def save(self, *args, **kwargs):
-        """Generate request number if not provided."""
-        if not self.request_number:
-            from django.utils import timezone
-            timestamp = timezone.now().strftime('%Y%m%d%H%M%S')
-            self.request_number = f"SR-{timestamp}"
-        super().save(*args, **kwargs)
-
 
 class ServiceNote(models.Model):
     """Service note model for tracking service progress."""
@@ -294,24 +328,24 @@ class Schedule(models.Model):
     class Meta:
         verbose_name = _('Schedule')
         verbose_name_plural = _('Schedules')
-        ordering = ['start_time']
+        ordering = ['start_time', 'created_at']
         indexes = [
             models.Index(fields=['technician']),
             models.Index(fields=['service_request']),
-            models.Index(fields=['start_time']),
+            models.Index(fields=['start_time', 'created_at', 'id'], name='schedule_start_created_idx'),
             models.Index(fields=['is_confirmed']),
         ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(end_time__gt=models.F('start_time')),
+                name='schedule_valid_time_range',
+                violation_error_message=_('End time must be after start time.'),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.technician.full_name} - {self.service_request.request_number}"
 
-    def clean(self):
-        """Validate schedule times."""
-        from django.core.exceptions import ValidationError
-        
-        if self.start_time >= self.end_time:
-            raise ValidationError(_('End time must be after start time.'))
-
 
 class ServiceRating(models.Model):
     """Service rating model for customer feedback."""
@@ -350,7 +384,6 @@ class ServiceRating(models.Model):
         verbose_name_plural = _('Service Ratings')
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['service_request']),
             models.Index(fields=['rating']),
             models.Index(fields=['created_at']),
         ]
@@ -5,6 +5,9 @@ This module contains serializers for service requests, technicians, and scheduli
 """
 
 from rest_framework import serializers
+
+from core.serializers import ConstraintErrorsMixin
+
 from .models import ServiceRequest, ServiceType, Technician, ServiceNote, Schedule, ServiceRating
 
 
@@ -29,7 +32,6 @@ class ServiceTypeSerializer(serializers.ModelSerializer):
 class TechnicianSerializer(serializers.ModelSerializer):
     """Serializer for Technician model."""
     
-    full_name = serializers.ReadOnlyField()
     user_name = serializers.CharField(source='user.full_name', read_only=True)
     user_email = serializers.CharField(source='user.email', read_only=True)
     
@@ -51,6 +53,8 @@ class TechnicianSerializer(serializers.ModelSerializer):
             'updated_at',
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
+        # Validating specializations only needs the ids to exist
+        extra_kwargs = {'specializations': {'queryset': ServiceType.objects.only('id')}}
 
 
 class ServiceRequestSerializer(serializers.ModelSerializer):
@@ -99,6 +103,16 @@ class ServiceRequestSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'request_number', 'created_at', 'updated_at']
 
 
+class ServiceRequestListSerializer(ServiceRequestSerializer):
+    """Serializer for service request list rows, without the description and address."""
+    
+    class Meta(ServiceRequestSerializer.Meta):
+        fields = [
+            field for field in ServiceRequestSerializer.Meta.fields
+            if field not in ('description', 'service_address')
+        ]
+
+
 class ServiceNoteSerializer(serializers.ModelSerializer):
     """Serializer for ServiceNote model."""
     
@@ -120,9 +134,14 @@ class ServiceNoteSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
-class ScheduleSerializer(serializers.ModelSerializer):
+class ScheduleSerializer(ConstraintErrorsMixin, serializers.ModelSerializer):
     """Serializer for Schedule model."""
     
+    # Exclusion constraint added by migration 0006 on PostgreSQL only
+    constraint_error_messages = {
+        'schedule_no_technician_overlap': 'The technician is already scheduled during this time.',
+    }
+    
     technician_name = serializers.CharField(source='technician.full_name', read_only=True)
     service_request_number = serializers.CharField(source='service_request.request_number', read_only=True)
     created_by_name = serializers.CharField(source='created_by.full_name', read_only=True)
@@ -146,6 +165,30 @@ class ScheduleSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at']
 
 
+class ScheduleListSerializer(serializers.Serializer):
+    """Serializer for schedule list rows read as ``values()`` dictionaries."""
+    
+    id = serializers.IntegerField(read_only=True)
+    technician = serializers.IntegerField(read_only=True)
+    technician_name = serializers.CharField(source='technician__full_name', read_only=True)
+    service_request = serializers.IntegerField(read_only=True)
+    service_request_number = serializers.CharField(source='service_request__request_number', read_only=True)
+    start_time = serializers.DateTimeField(read_only=True)
+    end_time = serializers.DateTimeField(read_only=True)
+    notes = serializers.CharField(read_only=True)
+    is_confirmed = serializers.BooleanField(read_only=True)
+    created_at = serializers.DateTimeField(read_only=True)
+    created_by = serializers.IntegerField(read_only=True)
+    created_by_name = serializers.CharField(source='created_by__full_name', read_only=True)
+    
+    def to_representation(self, instance):
+        """Leave out the creator name when there is no creator, as ScheduleSerializer does."""
+        data = super().to_representation(instance)
+        if data['created_by'] is None:
+            del data['created_by_name']
+        return data
+
+
 class ServiceRatingSerializer(serializers.ModelSerializer):
     """Serializer for ServiceRating model."""
     
@@ -0,0 +1,27 @@
+"""
+Services signal handlers for the Farjad ERP system.
+
+This module keeps the names stored on technicians in sync with their users.
+"""
+
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .models import Technician
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=User)
+def sync_technician_full_name(sender, instance, update_fields=None, **kwargs):
+    """Copy a renamed user's full name onto their technician profile.
+
+    Saves that leave the name alone, such as the ``last_login`` update made
+    on every login, skip the query.
+    """
+    if update_fields is not None and not {'first_name', 'last_name'} & set(update_fields):
+        return
+    Technician.objects.filter(user=instance).exclude(full_name=instance.full_name).update(
+        full_name=instance.full_name
+    )
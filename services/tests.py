@@ -1,3 +1,184 @@
-from django.test import TestCase
+import datetime
+from importlib import import_module
+from unittest import mock
 
-# Create your tests here.
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.db import IntegrityError
+from django.contrib.admin.sites import site
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+from rest_framework.test import APIClient
+
+from core.models import Contact
+from core.pagination import DateCursorPagination
+
+from .models import Schedule, ServiceNote, ServiceRequest, ServiceType, Technician
+from .serializers import ScheduleSerializer
+
+User = get_user_model()
+
+
+class ServicesTestData(TestCase):
+    """Shared service request and technician fixtures."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='tech', email='tech@example.com', password='pw',
+            first_name='Field', last_name='Tech',
+        )
+        self.technician = Technician.objects.create(
+            user=self.user, employee_id='T-1', skill_level='senior', hourly_rate=10,
+        )
+        self.service_type = ServiceType.objects.create(
+            name='Repair', base_price=100, estimated_duration=datetime.timedelta(hours=1),
+        )
+        customer = Contact.objects.create(
+            first_name='Jane', last_name='Doe', email='jane@example.com', contact_type='customer',
+        )
+        self.service_request = ServiceRequest.objects.create(
+            title='Broken heater', description='No heat', customer=customer,
+            service_type=self.service_type, requested_date=timezone.now(),
+        )
+
+
+class ScheduleSerializerConstraintTests(ServicesTestData):
+    """Schedule constraint violations are reported by name; others propagate."""
+
+    def serializer(self, hours):
+        start = timezone.now()
+        serializer = ScheduleSerializer(data={
+            'technician': self.technician.pk,
+            'service_request': self.service_request.pk,
+            'start_time': start,
+            'end_time': start + datetime.timedelta(hours=hours),
+        })
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        return serializer
+
+    def assert_save_reports(self, serializer, message):
+        with self.assertRaises(ValidationError) as raised:
+            serializer.save()
+        self.assertEqual(raised.exception.detail['non_field_errors'], [message])
+
+    def test_end_before_start(self):
+        self.assert_save_reports(self.serializer(-1), 'End time must be after start time.')
+        self.assertFalse(Schedule.objects.exists())
+
+    def test_technician_overlap(self):
+        error = IntegrityError(
+            'conflicting key value violates exclusion constraint "schedule_no_technician_overlap"'
+        )
+        with mock.patch.object(Schedule, 'save', side_effect=error):
+            self.assert_save_reports(
+                self.serializer(1), 'The technician is already scheduled during this time.'
+            )
+
+    def test_unrelated_integrity_error_is_not_rewritten(self):
+        with mock.patch.object(Schedule, 'save', side_effect=IntegrityError('other failure')):
+            with self.assertRaises(IntegrityError):
+                self.serializer(1).save()
+
+
+class TechnicianFullNameSyncTests(ServicesTestData):
+    """Renaming a user renames their technician profile."""
+
+    def test_rename_is_copied(self):
+        self.user.first_name = 'Lead'
+        self.user.save(update_fields=['first_name'])
+        self.technician.refresh_from_db()
+        self.assertEqual(self.technician.full_name, 'Lead Tech')
+
+    def test_unrelated_save_skips_the_query(self):
+        self.user.last_login = timezone.now()
+        with self.assertNumQueries(1):
+            self.user.save(update_fields=['last_login'])
+
+
+@mock.patch.object(DateCursorPagination, 'page_size', 3)
+class ScheduleCursorPaginationTests(ServicesTestData):
+    """The schedule list pages its dictionary rows across tied start times."""
+
+    def test_every_schedule_appears_once_in_order(self):
+        start = timezone.now()
+        Schedule.objects.bulk_create([
+            Schedule(
+                technician=self.technician,
+                service_request=self.service_request,
+                start_time=start + datetime.timedelta(days=index % 2),
+                end_time=start + datetime.timedelta(days=index % 2, hours=1),
+            )
+            for index in range(8)
+        ])
+        Schedule.objects.update(created_at=start)
+        client = APIClient()
+        client.force_authenticate(self.user)
+
+        ids = []
+        url = '/api/services/schedules/'
+        while url:
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200)
+            ids += [row['id'] for row in response.data['results']]
+            url = response.data['next']
+
+        expected = list(Schedule.objects.order_by('start_time', 'created_at', 'id').values_list('id', flat=True))
+        self.assertEqual(ids, expected)
+
+
+class ScheduleConstraintMigrationTests(ServicesTestData):
+    """The constraint migration names the rows that would break it."""
+
+    check_schedule_times = staticmethod(
+        import_module('services.migrations.0006_schedule_time_constraints').check_schedule_times
+    )
+
+    def schedule(self, start_hour, end_hour):
+        start = timezone.now().replace(minute=0, second=0, microsecond=0)
+        return Schedule(
+            technician=self.technician,
+            service_request=self.service_request,
+            start_time=start + datetime.timedelta(hours=start_hour),
+            end_time=start + datetime.timedelta(hours=end_hour),
+        )
+
+    def run_check(self, vendor='postgresql'):
+        schema_editor = mock.Mock(**{'connection.vendor': vendor})
+        self.check_schedule_times(apps, schema_editor)
+
+    def test_clean_rows_pass(self):
+        Schedule.objects.bulk_create([self.schedule(0, 1), self.schedule(1, 2)])
+        self.run_check()
+
+    def test_overlapping_rows_are_listed(self):
+        first, second, _ = Schedule.objects.bulk_create(
+            [self.schedule(0, 2), self.schedule(1, 3), self.schedule(5, 6)]
+        )
+        with self.assertRaisesMessage(RuntimeError, f'overlapping schedules of one technician: {[first.pk, second.pk]}'):
+            self.run_check()
+        self.run_check(vendor='sqlite')
+
+
+class ServiceNoteAdminTests(ServicesTestData):
+    """Only the changelist swaps the note for its database-side preview."""
+
+    def setUp(self):
+        super().setUp()
+        self.note = ServiceNote.objects.create(service_request=self.service_request, note='x' * 80)
+        self.model_admin = site._registry[ServiceNote]
+
+    def queryset_for(self, url_name):
+        request = RequestFactory().get('/')
+        request.resolver_match = mock.Mock(url_name=url_name)
+        return self.model_admin.get_queryset(request)
+
+    def test_changelist_loads_only_the_preview(self):
+        note = self.queryset_for('services_servicenote_changelist').get()
+        self.assertEqual(note.get_deferred_fields(), {'note'})
+        self.assertEqual(self.model_admin.note_preview(note), 'x' * 50 + '...')
+
+    def test_change_view_loads_the_full_note(self):
+        note = self.queryset_for('services_servicenote_change').get()
+        self.assertEqual(note.get_deferred_fields(), set())
+        self.assertEqual(note.note, 'x' * 80)
@@ -10,13 +10,19 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from core.mixins import AutoPrefetchMixin
+from core.pagination import CreatedAtCursorPagination, DateCursorPagination
+
+from .filters import ServiceRequestFilter, ServiceTypeFilter, TechnicianFilter, ScheduleFilter
 from .models import ServiceRequest, ServiceType, Technician, ServiceNote, Schedule, ServiceRating
 from .serializers import (
     ServiceRequestSerializer,
+    ServiceRequestListSerializer,
     ServiceTypeSerializer,
     TechnicianSerializer,
     ServiceNoteSerializer,
     ScheduleSerializer,
+    ScheduleListSerializer,
     ServiceRatingSerializer,
 )
 
@@ -29,17 +35,52 @@ from .serializers import (
     partial_update=extend_schema(summary="Partially update service request", description="Partially update a specific service request"),
     destroy=extend_schema(summary="Delete service request", description="Delete a specific service request"),
 )
-class ServiceRequestViewSet(viewsets.ModelViewSet):
+class ServiceRequestViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing service requests."""
     
     queryset = ServiceRequest.objects.all()
     serializer_class = ServiceRequestSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['status', 'priority', 'service_type', 'assigned_technician']
+    filterset_class = ServiceRequestFilter
     search_fields = ['request_number', 'title', 'description', 'customer__first_name', 'customer__last_name']
     ordering_fields = ['created_at', 'requested_date', 'scheduled_date', 'priority']
     ordering = ['-created_at']
+    pagination_class = CreatedAtCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Leave the description, address and unused related columns behind
+            queryset = queryset.only(
+                'id',
+                'request_number',
+                'title',
+                'customer__full_name',
+                'customer_company__name',
+                'service_type__name',
+                'priority',
+                'status',
+                'assigned_technician__full_name',
+                'assigned_at',
+                'assigned_by__full_name',
+                'requested_date',
+                'scheduled_date',
+                'started_at',
+                'completed_at',
+                'estimated_cost',
+                'actual_cost',
+                'service_city',
+                'created_at',
+                'updated_at',
+                'created_by__full_name',
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ServiceRequestListSerializer
+        return super().get_serializer_class()
 
 
 @extend_schema_view(
@@ -50,14 +91,14 @@ class ServiceRequestViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update service type", description="Partially update a specific service type"),
     destroy=extend_schema(summary="Delete service type", description="Delete a specific service type"),
 )
-class ServiceTypeViewSet(viewsets.ModelViewSet):
+class ServiceTypeViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing service types."""
     
     queryset = ServiceType.objects.all()
     serializer_class = ServiceTypeSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['is_active']
+    filterset_class = ServiceTypeFilter
     search_fields = ['name', 'description']
     ordering_fields = ['name', 'base_price', 'created_at']
     ordering = ['name']
@@ -71,14 +112,14 @@ class ServiceTypeViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update technician", description="Partially update a specific technician"),
     destroy=extend_schema(summary="Delete technician", description="Delete a specific technician"),
 )
-class TechnicianViewSet(viewsets.ModelViewSet):
+class TechnicianViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing technicians."""
     
     queryset = Technician.objects.all()
     serializer_class = TechnicianSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['skill_level', 'is_available']
+    filterset_class = TechnicianFilter
     search_fields = ['user__first_name', 'user__last_name', 'employee_id']
     ordering_fields = ['user__last_name', 'skill_level', 'created_at']
     ordering = ['user__last_name', 'user__first_name']
@@ -92,14 +133,40 @@ class TechnicianViewSet(viewsets.ModelViewSet):
     partial_update=extend_schema(summary="Partially update schedule", description="Partially update a specific schedule"),
     destroy=extend_schema(summary="Delete schedule", description="Delete a specific schedule"),
 )
-class ScheduleViewSet(viewsets.ModelViewSet):
+class ScheduleViewSet(AutoPrefetchMixin, viewsets.ModelViewSet):
     """ViewSet for managing schedules."""
     
     queryset = Schedule.objects.all()
     serializer_class = ScheduleSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
-    filterset_fields = ['technician', 'is_confirmed']
+    filterset_class = ScheduleFilter
     search_fields = ['technician__user__first_name', 'technician__user__last_name', 'notes']
     ordering_fields = ['start_time', 'end_time', 'created_at']
-    ordering = ['start_time']
\ No newline at end of file
+    ordering = ['start_time', 'created_at']
+    pagination_class = DateCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            # Rows are serialized straight from dictionaries, without model instances
+            queryset = queryset.values(
+                'id',
+                'technician',
+                'technician__full_name',
+                'service_request',
+                'service_request__request_number',
+                'start_time',
+                'end_time',
+                'notes',
+                'is_confirmed',
+                'created_at',
+                'created_by',
+                'created_by__full_name',
+            )
+        return queryset
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return ScheduleListSerializer
+        return super().get_serializer_class()
\ No newline at end of file